@@ -1,8 +1,8 @@
-import requests
-import json
-import time
+import asyncio
+import httpx
+import random
 
-def demo_api():
+async def demo_api():
     """Demonstrate the API functionality"""
     base_url = "http://localhost:5000"
     
@@ -12,23 +12,38 @@ def demo_api():
     print(f"Interactive Docs: {base_url}/docs")
     print("-" * 60)
     
+    # Reuse a single pooled client so every call shares keep-alive connections
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+    ) as client:
+        await run_demo(client, base_url)
+
+async def run_demo(client: httpx.AsyncClient, base_url: str):
+    """Run the demo steps against the API using a shared client"""
     # Wait for server to be ready
     print("Checking if server is ready...")
-    for i in range(10):
+    # Exponential backoff with jitter: near-instant when the server is already up,
+    # doubling waits (capped at 5s) while it is still starting
+    delay = 0.1
+    for attempt in range(8):
         try:
-            response = requests.get(f"{base_url}/health", timeout=5)
+            response = await client.get("/health", timeout=2.0)
             if response.status_code == 200:
                 print("Server is ready!")
                 break
-        except:
-            time.sleep(1)
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(delay * (1 + random.random() * 0.5))
+        delay = min(delay * 2, 5.0)
     else:
         print("Server not ready. Please start the server with: python deployment_script.py")
         return
     
     # Demo 1: Health Check
     print("\n1. HEALTH CHECK")
-    response = requests.get(f"{base_url}/health")
+    response = await client.get("/health")
     health_data = response.json()
     print(f"   Status: {health_data['status']}")
     print(f"   Products loaded: {health_data['total_products']}")
@@ -36,7 +51,7 @@ def demo_api():
     
     # Demo 2: Available Categories
     print("\n2. AVAILABLE CATEGORIES")
-    response = requests.get(f"{base_url}/categories")
+    response = await client.get("/categories")
     categories_data = response.json()
     print(f"   Total categories: {categories_data['total_categories']}")
     for category, count in categories_data['available_categories'].items():
@@ -55,7 +70,7 @@ def demo_api():
         "include_explanations": True
     }
     
-    response = requests.post(f"{base_url}/vendor_qualification", json=query)
+    response = await client.post("/vendor_qualification", json=query, params={"echo": False})
     
     if response.status_code == 200:
         result = response.json()
@@ -89,17 +104,22 @@ def demo_api():
     print("   Testing different similarity thresholds...")
     
     thresholds = [0.3, 0.5, 0.7]
-    for threshold in thresholds:
-        query = {
+    queries = [
+        {
             "software_category": "CRM Software",
             "capabilities": ["Lead Management"],
             "similarity_threshold": threshold,
             "top_n": 3
         }
-        
-        response = requests.post(f"{base_url}/vendor_qualification", json=query)
-        if response.status_code == 200:
-            result = response.json()
+        for threshold in thresholds
+    ]
+    
+    # One batch request: the server computes similarity once for the whole sweep
+    response = await client.post(
+        "/vendor_qualification/batch", json={"queries": queries}, params={"echo": False}
+    )
+    if response.status_code == 200:
+        for threshold, result in zip(thresholds, response.json()['responses']):
             qualified = result['results']['total_qualified_vendors']
             print(f"   - Threshold {threshold}: {qualified} vendors qualified")
     
@@ -114,7 +134,7 @@ def demo_api():
         "top_n": 10
     }
     
-    response = requests.post(f"{base_url}/vendor_qualification", json=query)
+    response = await client.post("/vendor_qualification", json=query, params={"echo": False})
     
     if response.status_code == 200:
         result = response.json()
@@ -158,4 +178,4 @@ def demo_api():
     print(f"   3. Use POST {base_url}/vendor_qualification")
 
 if __name__ == "__main__":
-    demo_api() 
\ No newline at end of file
+    asyncio.run(demo_api()) 
\ No newline at end of file
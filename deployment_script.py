@@ -32,6 +32,12 @@ def check_data_file():
     data_file = "data/G2 software - CRM Category Product Overviews.csv"
     if os.path.exists(data_file):
         print(f"Data file found: {data_file}")
+        # Build the Parquet cache up front so every server worker just reads it
+        try:
+            from data_processing.data_loader import ensure_parquet_cache
+            print(f"Parquet cache ready: {ensure_parquet_cache(data_file)}")
+        except (ImportError, OSError) as e:
+            print(f"Parquet cache unavailable, the CSV will be read directly: {e}")
         return True
     else:
         print(f"Data file not found: {data_file}")
@@ -60,14 +66,28 @@ def main():
     
     try:
         # Start the FastAPI server
-        uvicorn.run(
-            "src.api.app:app",
-            host="127.0.0.1",
-            port=5000,
-            reload=True,
-            log_level="info",
-            access_log=True
-        )
+        if os.getenv("ENVIRONMENT", "development") == "production":
+            # No reload supervisor; one uvloop/httptools worker per core.
+            # Each worker loads its own copy of the dataset.
+            uvicorn.run(
+                "src.api.app:app",
+                host="0.0.0.0",
+                port=5000,
+                workers=os.cpu_count() or 1,
+                loop="uvloop",
+                http="httptools",
+                log_level="warning",
+                access_log=False
+            )
+        else:
+            uvicorn.run(
+                "src.api.app:app",
+                host="127.0.0.1",
+                port=5000,
+                reload=True,
+                log_level="info",
+                access_log=True
+            )
     except KeyboardInterrupt:
         print("\nServer stopped by user")
     except Exception as e:
@@ -8,26 +8,62 @@ import subprocess
 import sys
 import time
 import argparse
+import io
 import os
+import random
+import shlex
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, TextIO
 
-def run_command(command: str, check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result"""
-    print(f"Running: {command}")
+# The Dockerfile's cache mounts need BuildKit, for plain and compose builds alike
+os.environ.setdefault("DOCKER_BUILDKIT", "1")
+os.environ.setdefault("COMPOSE_DOCKER_CLI_BUILD", "1")
+
+def run_command(command: str, check: bool = True,
+                out: Optional[TextIO] = None) -> subprocess.CompletedProcess:
+    """
+    Run a command directly (no intermediate shell) and return the result.
+    Its output and progress messages go to `out` (stdout by default).
+    """
+    print(f"Running: {command}", file=out)
+    args = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, check=check, capture_output=True, text=True)
+        result = subprocess.run(args, check=check, capture_output=True, text=True)
         if result.stdout:
-            print(result.stdout)
+            print(result.stdout, file=out)
         return result
+    except FileNotFoundError as e:
+        # Mirror the shell's "command not found" exit status
+        print(f"Command not found: {args[0]}", file=out)
+        if check:
+            sys.exit(1)
+        return subprocess.CompletedProcess(args, 127, "", str(e))
     except subprocess.CalledProcessError as e:
-        print(f"Command failed: {e}")
+        print(f"Command failed: {e}", file=out)
         if e.stderr:
-            print(f"Error: {e.stderr}")
+            print(f"Error: {e.stderr}", file=out)
         if check:
             sys.exit(1)
         return e
 
+def run_commands_concurrently(commands: List[str]) -> List[subprocess.CompletedProcess]:
+    """
+    Run independent commands in parallel without failing on errors.
+    
+    Each command's output is buffered and printed once all have finished,
+    in command order, so concurrent output never interleaves.
+    """
+    buffers = [io.StringIO() for _ in commands]
+    with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+        results = list(executor.map(
+            lambda command, buffer: run_command(command, check=False, out=buffer), commands, buffers
+        ))
+    print("".join(buffer.getvalue() for buffer in buffers), end="")
+    return results
+
 def check_docker():
     """Check if Docker is installed and running"""
     print("Checking Docker installation...")
@@ -73,9 +109,8 @@ def run_container(
     """Run the Docker container"""
     print(f"Starting container: {name}")
     
-    # Stop existing container if running
-    run_command(f"docker stop {name}", check=False)
-    run_command(f"docker rm {name}", check=False)
+    # Stop and remove existing container if running
+    run_command(f"docker rm -f {name}", check=False)
     
     # Run new container
     detach_flag = "-d" if detached else ""
@@ -99,30 +134,36 @@ def stop_services():
     """Stop all running services"""
     print("Stopping services...")
     
-    # Stop docker-compose services
-    run_command("docker-compose down", check=False)
-    
-    # Stop individual container
-    run_command("docker stop vendor-api", check=False)
-    run_command("docker rm vendor-api", check=False)
+    # Stop docker-compose services and the individual container in parallel
+    run_commands_concurrently([
+        "docker-compose down",
+        "docker rm -f vendor-api"
+    ])
     
     print("All services stopped!")
 
-def check_health(url: str = "http://localhost:5000", max_attempts: int = 30):
-    """Check if the API is healthy"""
+def check_health(url: str = "http://localhost:5000", max_attempts: int = 12):
+    """Check if the API is healthy, backing off exponentially between attempts"""
     print(f"Checking API health at {url}...")
     
-    for attempt in range(max_attempts):
-        try:
-            response = requests.get(f"{url}/health", timeout=5)
-            if response.status_code == 200:
-                print("API is healthy!")
-                return True
-        except requests.RequestException:
-            pass
+    # One session for all attempts so the connection is reused once it is up;
+    # retries are handled by the backoff loop, not by urllib3
+    with requests.Session() as session:
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(total=0)))
         
-        print(f"Waiting for API... (attempt {attempt + 1}/{max_attempts})")
-        time.sleep(2)
+        delay = 0.5
+        for attempt in range(max_attempts):
+            try:
+                response = session.get(f"{url}/health", timeout=2)
+                if response.status_code == 200:
+                    print("API is healthy!")
+                    return True
+            except requests.RequestException:
+                pass
+            
+            print(f"Waiting for API... (attempt {attempt + 1}/{max_attempts})")
+            time.sleep(delay * (1 + random.random() * 0.5))
+            delay = min(delay * 2, 10.0)
     
     print("API health check failed!")
     return False
@@ -136,10 +177,11 @@ def cleanup():
     """Clean up Docker resources"""
     print("Cleaning up Docker resources...")
     
-    # Stop and remove containers
-    run_command("docker-compose down --remove-orphans", check=False)
-    run_command("docker stop vendor-api", check=False)
-    run_command("docker rm vendor-api", check=False)
+    # Stop and remove containers in parallel; images can only go once they are gone
+    run_commands_concurrently([
+        "docker-compose down --remove-orphans",
+        "docker rm -f vendor-api"
+    ])
     
     # Remove images
     run_command("docker rmi vendor-qualification:latest", check=False)
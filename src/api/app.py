@@ -1,9 +1,17 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 import sys
 import os
 import logging
+import hashlib
+import anyio
+import orjson
 
 # Add src directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -16,12 +24,31 @@ from ranking.vendor_ranker import VendorRanker
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker threads available to sync endpoints and offloaded pipeline work.
+# Unset keeps anyio's default of 40. The pipeline is CPU-bound and holds the
+# GIL, so threads beyond a few per core only queue up; a smaller pool on small
+# containers bounds how many queries are in flight (and in memory) at once.
+THREADPOOL_SIZE = int(os.environ["THREADPOOL_SIZE"]) if os.environ.get("THREADPOOL_SIZE") else None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the worker thread pool used for CPU-bound request handling, if configured."""
+    if THREADPOOL_SIZE is not None:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
 app = FastAPI(
     title="Vendor Qualification System",
     description="A system to qualify and rank software vendors based on semantic similarity matching of capabilities",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
+# Compress larger JSON bodies (ranked vendors, detailed matches, vendor lists)
+# for clients that accept gzip; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Initialize components
 try:
     data_loader = DataLoader("data/G2 software - CRM Category Product Overviews.csv")
@@ -33,20 +60,240 @@ except Exception as e:
 feature_matcher = FeatureMatcher(similarity_threshold=0.5)
 vendor_ranker = VendorRanker(feature_weight=0.7, rating_weight=0.3)
 
+# Fit the TF-IDF vocabulary over the whole feature corpus once so queries only
+# transform their capabilities
+if data_loader is not None:
+    feature_matcher.fit(data_loader.preprocessed_dataset)
+
+# Methodology text is the same for every successful response (only the
+# threshold varies per query), so it is built once and shared
+SIMILARITY_METHODOLOGY_DESCRIPTION = "Uses TF-IDF vectorization and cosine similarity to match capabilities with feature descriptions"
+SIMILARITY_TEXT_PROCESSING = "Combines feature name and description, includes unigrams and bigrams"
+RANKING_METHODOLOGY = {
+    "description": f"Weighted combination of similarity score ({vendor_ranker.feature_weight}) and vendor rating ({vendor_ranker.rating_weight})",
+    "formula": "rank_score = feature_weight * max_similarity + rating_weight * normalized_rating"
+}
+
+# Maximum number of raw feature matches returned as detailed_matches
+DETAILED_MATCHES_LIMIT = 50
+
+# Maximum number of queries accepted in one batch request
+BATCH_QUERIES_LIMIT = 50
+
+# Seconds clients may reuse cached responses from the static dataset endpoints
+CACHE_MAX_AGE = 3600
+
 class VendorQuery(BaseModel):
+    # Queries are read-only once validated
+    model_config = ConfigDict(frozen=True)
+    
     software_category: str
     capabilities: List[str]
-    similarity_threshold: Optional[float] = 0.5
-    top_n: Optional[int] = 10
-    include_explanations: Optional[bool] = False
+    similarity_threshold: float = Field(0.5, ge=0.0, le=1.0)
+    top_n: int = Field(10, ge=1, le=100)
+    include_explanations: bool = False
+
+class VendorBatchQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    
+    queries: List[VendorQuery] = Field(..., max_length=BATCH_QUERIES_LIMIT)
+
+def _serialize_payload(payload: dict) -> Tuple[bytes, str]:
+    """
+    Serialize a response payload once with orjson and derive its ETag.
+    
+    The ETag is weak: GZipMiddleware may send the same payload compressed or
+    not, and a strong validator would have to differ between the two.
+    
+    Args:
+        payload (dict): JSON-serializable response payload
+        
+    Returns:
+        Tuple[bytes, str]: JSON body and its weak ETag
+    """
+    # Same options ORJSONResponse uses, so cached and live responses match
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+    return body, etag
+
+def _query_echo(query: VendorQuery, echo: bool) -> dict:
+    """Echo the full query back, or just its category when the caller opts out."""
+    return query.model_dump() if echo else {"software_category": query.software_category}
+
+def _run_qualification_pipeline(query: VendorQuery, echo: bool = True) -> dict:
+    """
+    Run the synchronous, CPU-bound matching and ranking steps for a query.
+    
+    Kept separate from the endpoint so it can be executed in a worker thread
+    instead of blocking the event loop.
+    
+    Args:
+        query (VendorQuery): Query containing software category, capabilities, and options
+        echo (bool): Whether to echo the full query in the response
+        
+    Returns:
+        dict: Comprehensive results including ranked vendors, matches, and analysis
+    """
+    # Step 1: Filter vendors by category and find capability matches
+    matching_results = feature_matcher.filter_vendors_by_category_and_capabilities(
+        dataframe=data_loader.preprocessed_dataset,
+        software_category=query.software_category,
+        capabilities=query.capabilities,
+        similarity_threshold=query.similarity_threshold,
+        # Raw matches are only returned as detailed_matches, so keep no more than that
+        max_raw_matches=DETAILED_MATCHES_LIMIT if query.include_explanations else 0
+    )
+    
+    return _build_qualification_response(query, matching_results, echo)
+
+def _run_batch_pipeline(queries: List[VendorQuery], echo: bool = True) -> List[dict]:
+    """
+    Run several qualification queries, sharing similarity work between them.
+    
+    Queries with the same category and capabilities differ at most in threshold
+    and presentation, so each group is matched once at its lowest threshold
+    and the matches are narrowed per query.
+    
+    Args:
+        queries (List[VendorQuery]): Queries to run
+        echo (bool): Whether to echo each full query in its response
+        
+    Returns:
+        List[dict]: One qualification response per query, in request order
+    """
+    groups: Dict[Tuple[str, Tuple[str, ...]], List[int]] = {}
+    for position, query in enumerate(queries):
+        groups.setdefault((query.software_category, tuple(query.capabilities)), []).append(position)
+    
+    responses: List[dict] = [{} for _ in queries]
+    for (software_category, capabilities), positions in groups.items():
+        thresholds = {position: queries[position].similarity_threshold for position in positions}
+        
+        group_results = feature_matcher.filter_vendors_by_category_and_capabilities(
+            dataframe=data_loader.preprocessed_dataset,
+            software_category=software_category,
+            capabilities=list(capabilities),
+            similarity_threshold=min(thresholds.values())
+        )
+        
+        for position in positions:
+            matching_results = feature_matcher.apply_threshold(group_results, thresholds[position])
+            responses[position] = _build_qualification_response(queries[position], matching_results, echo)
+    
+    return responses
+
+def _build_qualification_response(query: VendorQuery,
+                                  matching_results: Dict[str, Any],
+                                  echo: bool = True) -> dict:
+    """
+    Rank matched vendors and assemble the qualification response for a query.
+    
+    Args:
+        query (VendorQuery): Query containing software category, capabilities, and options
+        matching_results (Dict[str, Any]): Capability matches for the query
+        echo (bool): Whether to echo the full query in the response
+        
+    Returns:
+        dict: Comprehensive results including ranked vendors, matches, and analysis
+    """
+    if not matching_results['matching_vendors']:
+        return {
+            "query": _query_echo(query, echo),
+            "results": {
+                "ranked_vendors": [],
+                "total_qualified_vendors": 0,
+                "message": f"No vendors found matching capabilities {query.capabilities} in category '{query.software_category}' with similarity threshold {query.similarity_threshold}"
+            },
+            "summary": matching_results,
+            "analysis": {
+                "threshold_impact": f"Consider lowering similarity threshold (currently {query.similarity_threshold}) to find more matches",
+                "suggestions": [
+                    "Try broader capability terms",
+                    "Check if the software category exists in the dataset",
+                    "Lower the similarity threshold to 0.4-0.5"
+                ]
+            }
+        }
+    
+    # Step 2: Add rating information to vendor data (from original dataset);
+    # matching results may be shared through the matcher's cache, so the
+    # vendor dicts are copied rather than annotated in place
+    product_rating = data_loader.product_rating
+    enhanced_vendors = {
+        vendor_key: {**vendor_data, 'rating': product_rating.get(vendor_data['product_name'], 0.0)}
+        for vendor_key, vendor_data in matching_results['matching_vendors'].items()
+    }
+    
+    # Step 3: Rank vendors
+    ranked_vendors = vendor_ranker.rank_vendors(enhanced_vendors, top_n=query.top_n)
+    
+    # Step 4: Add explanations if requested
+    if query.include_explanations:
+        ranked_vendors = vendor_ranker.add_ranking_explanation(ranked_vendors)
+    
+    # Step 5: Generate summary statistics
+    ranking_summary = vendor_ranker.get_ranking_summary(ranked_vendors)
+    
+    # Step 6: Prepare comprehensive response
+    response = {
+        "query": _query_echo(query, echo),
+        "results": {
+            "ranked_vendors": ranked_vendors,
+            "total_qualified_vendors": len(enhanced_vendors),
+            "returned_vendors": len(ranked_vendors)
+        },
+        "matching_analysis": {
+            "total_feature_matches": matching_results['total_matches'],
+            "capabilities_searched": matching_results['capabilities_searched'],
+            "category_searched": matching_results['category_searched'],
+            "similarity_threshold_used": matching_results['similarity_threshold']
+        },
+        "ranking_summary": ranking_summary,
+        "methodology": {
+            "similarity_matching": {
+                "description": SIMILARITY_METHODOLOGY_DESCRIPTION,
+                "threshold": query.similarity_threshold,
+                "text_processing": SIMILARITY_TEXT_PROCESSING
+            },
+            "ranking": RANKING_METHODOLOGY
+        }
+    }
+    
+    # Add detailed matches for debugging if requested
+    if query.include_explanations:
+        response["detailed_matches"] = matching_results.get('raw_matches', [])[:DETAILED_MATCHES_LIMIT]
+    
+    logger.info(f"Successfully processed query, returning {len(ranked_vendors)} vendors")
+    return response
 
-class VendorQualificationResponse(BaseModel):
-    query: VendorQuery
-    results: dict
-    summary: dict
+# The pipeline is deterministic for a given query and the dataset is immutable,
+# so serialized results are memoized per exact set of query fields
+@lru_cache(maxsize=512)
+def _cached_qualification(software_category: str,
+                          capabilities: Tuple[str, ...],
+                          similarity_threshold: float,
+                          top_n: int,
+                          include_explanations: bool,
+                          echo: bool) -> bytes:
+    """
+    Run the qualification pipeline for a hashable query key and serialize the result.
+    
+    Returns:
+        bytes: JSON body of the qualification response
+    """
+    # The fields were validated when the request was parsed, so skip re-validation
+    query = VendorQuery.model_construct(
+        software_category=software_category,
+        capabilities=list(capabilities),
+        similarity_threshold=similarity_threshold,
+        top_n=top_n,
+        include_explanations=include_explanations
+    )
+    body, _ = _serialize_payload(_run_qualification_pipeline(query, echo))
+    return body
 
-@app.post("/vendor_qualification", response_model=dict)
-async def qualify_vendors(query: VendorQuery):
+@app.post("/vendor_qualification")
+async def qualify_vendors(query: VendorQuery, echo: Annotated[bool, Query()] = True):
     """
     Qualify and rank vendors based on category and capabilities using semantic similarity matching.
     
@@ -59,6 +306,8 @@ async def qualify_vendors(query: VendorQuery):
     
     Args:
         query (VendorQuery): Query containing software category, capabilities, and options
+        echo (bool): Whether to echo the full query in the response; pass echo=0
+            to omit it and keep responses small
         
     Returns:
         dict: Comprehensive results including ranked vendors, matches, and analysis
@@ -67,104 +316,150 @@ async def qualify_vendors(query: VendorQuery):
         if data_loader is None:
             raise HTTPException(status_code=500, detail="Data loader not initialized")
         
-        logger.info(f"Processing vendor qualification query: {query.dict()}")
+        logger.info(f"Processing vendor qualification query: {query.model_dump()}")
         
-        # Update feature matcher threshold if provided
-        if query.similarity_threshold:
-            feature_matcher.similarity_threshold = query.similarity_threshold
-        
-        # Step 1: Filter vendors by category and find capability matches
-        matching_results = feature_matcher.filter_vendors_by_category_and_capabilities(
-            dataframe=data_loader.preprocessed_dataset,
-            software_category=query.software_category,
-            capabilities=query.capabilities
+        # Offload the CPU-bound pipeline so the event loop keeps serving requests
+        body = await run_in_threadpool(
+            _cached_qualification,
+            query.software_category,
+            tuple(query.capabilities),
+            query.similarity_threshold,
+            query.top_n,
+            query.include_explanations,
+            echo
         )
+        return Response(content=body, media_type="application/json")
         
-        if not matching_results['matching_vendors']:
-            return {
-                "query": query.dict(),
-                "results": {
-                    "ranked_vendors": [],
-                    "total_qualified_vendors": 0,
-                    "message": f"No vendors found matching capabilities {query.capabilities} in category '{query.software_category}' with similarity threshold {query.similarity_threshold}"
-                },
-                "summary": matching_results,
-                "analysis": {
-                    "threshold_impact": f"Consider lowering similarity threshold (currently {query.similarity_threshold}) to find more matches",
-                    "suggestions": [
-                        "Try broader capability terms",
-                        "Check if the software category exists in the dataset",
-                        "Lower the similarity threshold to 0.4-0.5"
-                    ]
-                }
-            }
-        
-        # Step 2: Add rating information to vendor data (from original dataset)
-        enhanced_vendors = {}
-        for vendor_key, vendor_data in matching_results['matching_vendors'].items():
-            # Find rating from original data
-            product_name = vendor_data['product_name']
-            original_data = data_loader.data[data_loader.data['product_name'] == product_name]
-            
-            if not original_data.empty:
-                rating = original_data.iloc[0].get('rating', 0.0)
-                vendor_data['rating'] = rating
-            else:
-                vendor_data['rating'] = 0.0
-            
-            enhanced_vendors[vendor_key] = vendor_data
-        
-        # Step 3: Rank vendors
-        ranked_vendors = vendor_ranker.rank_vendors(enhanced_vendors, top_n=query.top_n)
-        
-        # Step 4: Add explanations if requested
-        if query.include_explanations:
-            ranked_vendors = vendor_ranker.add_ranking_explanation(ranked_vendors)
-        
-        # Step 5: Generate summary statistics
-        ranking_summary = vendor_ranker.get_ranking_summary(ranked_vendors)
+    except Exception as e:
+        logger.error(f"Error processing vendor qualification: {e}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+@app.post("/vendor_qualification/batch")
+async def qualify_vendors_batch(batch: VendorBatchQuery, echo: Annotated[bool, Query()] = True):
+    """
+    Qualify and rank vendors for several queries in one request.
+    
+    Queries that share a category and capabilities (for example a sweep over
+    similarity thresholds) reuse a single similarity computation.
+    
+    Args:
+        batch (VendorBatchQuery): Queries to run
+        echo (bool): Whether to echo each full query in its response
         
-        # Step 6: Prepare comprehensive response
-        response = {
-            "query": query.dict(),
-            "results": {
-                "ranked_vendors": ranked_vendors,
-                "total_qualified_vendors": len(enhanced_vendors),
-                "returned_vendors": len(ranked_vendors)
-            },
-            "matching_analysis": {
-                "total_feature_matches": matching_results['total_matches'],
-                "capabilities_searched": matching_results['capabilities_searched'],
-                "category_searched": matching_results['category_searched'],
-                "similarity_threshold_used": matching_results['similarity_threshold']
-            },
-            "ranking_summary": ranking_summary,
-            "methodology": {
-                "similarity_matching": {
-                    "description": "Uses TF-IDF vectorization and cosine similarity to match capabilities with feature descriptions",
-                    "threshold": query.similarity_threshold,
-                    "text_processing": "Combines feature name and description, includes unigrams and bigrams"
-                },
-                "ranking": {
-                    "description": f"Weighted combination of similarity score ({vendor_ranker.feature_weight}) and vendor rating ({vendor_ranker.rating_weight})",
-                    "formula": "rank_score = feature_weight * max_similarity + rating_weight * normalized_rating"
-                }
-            }
-        }
+    Returns:
+        dict: One qualification response per query, in request order
+    """
+    try:
+        if data_loader is None:
+            raise HTTPException(status_code=500, detail="Data loader not initialized")
         
-        # Add detailed matches for debugging if requested
-        if query.include_explanations:
-            response["detailed_matches"] = matching_results.get('raw_matches', [])[:50]  # Limit to first 50
+        logger.info(f"Processing batch of {len(batch.queries)} vendor qualification queries")
         
-        logger.info(f"Successfully processed query, returning {len(ranked_vendors)} vendors")
-        return response
+        responses = await run_in_threadpool(_run_batch_pipeline, batch.queries, echo)
+        body, _ = _serialize_payload({
+            "responses": responses,
+            "total_queries": len(responses)
+        })
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error processing vendor qualification: {e}")
+        logger.error(f"Error processing batch vendor qualification: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag.
+    
+    Uses the weak comparison If-None-Match calls for: the header may list
+    several tags separated by commas, each optionally W/-prefixed, or be "*".
+    
+    Args:
+        if_none_match (str, optional): Raw If-None-Match header value
+        etag (str): ETag of the current representation
+        
+    Returns:
+        bool: Whether the client's cached copy is still current
+    """
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+def _cached_json_response(request: Request, cached: Tuple[bytes, str]) -> Response:
+    """
+    Serve a precomputed JSON body, answering 304 when the client's ETag still matches.
+    
+    Args:
+        request (Request): Incoming request, checked for If-None-Match
+        cached (Tuple[bytes, str]): JSON body and ETag from _serialize_payload
+        
+    Returns:
+        Response: 304 Not Modified or the JSON body with caching headers
+    """
+    body, etag = cached
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={CACHE_MAX_AGE}"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# The dataset is loaded once at startup and never mutated, so these payloads
+# are static per set of query parameters and can be memoized for the process
+@lru_cache(maxsize=1)
+def _categories_payload() -> Tuple[bytes, str]:
+    """Build the serialized /categories payload."""
+    categories = data_loader.data['main_category'].value_counts().to_dict()
+    
+    return _serialize_payload({
+        "available_categories": categories,
+        "total_categories": len(categories),
+        "total_products": len(data_loader.data)
+    })
+
+@lru_cache(maxsize=256)
+def _vendors_payload(category: Optional[str]) -> Tuple[bytes, str]:
+    """Build the serialized /vendors payload for a category filter."""
+    if category:
+        filtered_data = data_loader.filter_by_category(category)
+    else:
+        filtered_data = data_loader.data
+    
+    vendors = filtered_data[['product_name', 'seller', 'rating', 'main_category']].drop_duplicates()
+    
+    # Encode records straight from the frame (handling NaN values) and splice the
+    # JSON in as-is, skipping the intermediate list of row dicts. Categorical
+    # columns cannot take the 0 fill value, so fill on plain objects.
+    vendors_json = vendors.astype(object).fillna(0).to_json(orient='records', force_ascii=False)
+    
+    return _serialize_payload({
+        "vendors": orjson.Fragment(vendors_json),
+        "total_vendors": len(vendors),
+        "category_filter": category
+    })
+
+@lru_cache(maxsize=256)
+def _features_payload(category: Optional[str], limit: int) -> Tuple[bytes, str]:
+    """Build the serialized /features payload for a category filter and limit."""
+    if category:
+        filtered_data = data_loader.filter_by_category(category, dataset='preprocessed_dataset')
+    else:
+        filtered_data = data_loader.preprocessed_dataset
+    
+    # Categorical counts list every category, including ones absent from this filter
+    feature_counts = filtered_data['Feature_name'].value_counts()
+    feature_counts = feature_counts[feature_counts > 0].head(limit)
+    
+    return _serialize_payload({
+        "common_features": orjson.Fragment(feature_counts.to_json(force_ascii=False)),
+        "total_unique_features": len(filtered_data['Feature_name'].unique()),
+        "category_filter": category
+    })
+
 @app.get("/categories")
-async def get_available_categories():
+def get_available_categories(request: Request):
     """
     Get list of available software categories in the dataset.
     
@@ -175,20 +470,15 @@ async def get_available_categories():
         if data_loader is None:
             raise HTTPException(status_code=500, detail="Data loader not initialized")
         
-        categories = data_loader.data['main_category'].value_counts().to_dict()
-        
-        return {
-            "available_categories": categories,
-            "total_categories": len(categories),
-            "total_products": len(data_loader.data)
-        }
+        return _cached_json_response(request, _categories_payload())
         
     except Exception as e:
         logger.error(f"Error getting categories: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/vendors")
-async def get_vendors_by_category(category: Optional[str] = None):
+def get_vendors_by_category(request: Request,
+                            category: Annotated[Optional[str], Query()] = None):
     """
     Get vendors filtered by category.
     
@@ -202,30 +492,16 @@ async def get_vendors_by_category(category: Optional[str] = None):
         if data_loader is None:
             raise HTTPException(status_code=500, detail="Data loader not initialized")
         
-        if category:
-            filtered_data = data_loader.data[
-                data_loader.data['main_category'].str.contains(category, case=False, na=False)
-            ]
-        else:
-            filtered_data = data_loader.data
-        
-        vendors = filtered_data[['product_name', 'seller', 'rating', 'main_category']].drop_duplicates()
-        
-        # Convert to records and handle NaN values
-        vendors_list = vendors.fillna(0).to_dict('records')
-        
-        return {
-            "vendors": vendors_list,
-            "total_vendors": len(vendors),
-            "category_filter": category
-        }
+        return _cached_json_response(request, _vendors_payload(category))
         
     except Exception as e:
         logger.error(f"Error getting vendors: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/features")
-async def get_common_features(category: Optional[str] = None, limit: Optional[int] = 20):
+def get_common_features(request: Request,
+                        category: Annotated[Optional[str], Query()] = None,
+                        limit: Annotated[int, Query(ge=1, le=1000)] = 20):
     """
     Get most common features in the dataset or by category.
     
@@ -240,20 +516,7 @@ async def get_common_features(category: Optional[str] = None, limit: Optional[in
         if data_loader is None:
             raise HTTPException(status_code=500, detail="Data loader not initialized")
         
-        if category:
-            filtered_data = data_loader.preprocessed_dataset[
-                data_loader.preprocessed_dataset['main_category'].str.contains(category, case=False, na=False)
-            ]
-        else:
-            filtered_data = data_loader.preprocessed_dataset
-        
-        feature_counts = filtered_data['Feature_name'].value_counts().head(limit)
-        
-        return {
-            "common_features": feature_counts.to_dict(),
-            "total_unique_features": len(filtered_data['Feature_name'].unique()),
-            "category_filter": category
-        }
+        return _cached_json_response(request, _features_payload(category, limit))
         
     except Exception as e:
         logger.error(f"Error getting features: {e}")
@@ -278,6 +541,7 @@ async def root():
         "description": "Semantic similarity-based vendor qualification and ranking system",
         "endpoints": {
             "POST /vendor_qualification": "Main endpoint for vendor qualification",
+            "POST /vendor_qualification/batch": "Run several vendor qualification queries at once",
             "GET /categories": "Get available software categories",
             "GET /vendors": "Get vendors by category",
             "GET /features": "Get common features",
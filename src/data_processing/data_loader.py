@@ -1,6 +1,117 @@
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_list_like
 from typing import List, Dict, Any
 import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality string columns stored as pandas categoricals in the Parquet cache
+CATEGORICAL_COLUMNS = ['main_category', 'product_name', 'seller']
+
+# Flattened feature columns with few distinct values, stored as categoricals
+# after preprocessing
+FEATURE_CATEGORICAL_COLUMNS = ['Features_Category', 'Feature_name']
+
+def _explode_values(value: Any) -> List[Any]:
+    """
+    Elements a pandas explode would produce for a single cell.
+    
+    List-likes yield their items (a single NaN when empty); anything else is
+    kept as a single element.
+    """
+    if is_list_like(value):
+        items = list(value)
+        return items if items else [np.nan]
+    return [value]
+
+def parquet_cache_path(csv_path: str) -> str:
+    """Path of the Parquet copy kept next to a CSV file."""
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+def to_categorical(df: pd.DataFrame, columns: List[str], ordered_by_appearance: bool = False) -> pd.DataFrame:
+    """
+    Convert the given columns, where present, to categorical dtype.
+    
+    Args:
+        df (pd.DataFrame): Input frame
+        columns (List[str]): Columns to convert
+        ordered_by_appearance (bool): List categories in order of first appearance
+            rather than sorted, so value_counts breaks ties the way it does for
+            plain object columns
+        
+    Returns:
+        pd.DataFrame: Frame with the present columns stored as categoricals
+    """
+    present = [col for col in columns if col in df.columns]
+    if not ordered_by_appearance:
+        return df.astype({col: 'category' for col in present})
+    return df.astype({
+        col: pd.CategoricalDtype(pd.unique(df[col].dropna())) for col in present
+    })
+
+def read_vendor_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Read the vendor CSV with pandas' multithreaded pyarrow parser when available.
+    
+    Missing values come back as None in text columns, the same as when the
+    Parquet cache is read. Falls back to the default C parser without pyarrow,
+    or when pyarrow's stricter parser rejects the file (e.g. short rows).
+    
+    Args:
+        csv_path (str): Path to the CSV file containing vendor data
+        
+    Returns:
+        pd.DataFrame: Raw vendor data with categorical dtypes applied
+    """
+    try:
+        df = pd.read_csv(csv_path, engine='pyarrow')
+    except ImportError:
+        df = pd.read_csv(csv_path)
+    except ValueError as e:
+        # pyarrow.ArrowInvalid and pandas' ParserError are both ValueErrors
+        logger.warning(f"pyarrow could not parse {csv_path}, retrying with the default parser: {e}")
+        df = pd.read_csv(csv_path)
+    return to_categorical(df, CATEGORICAL_COLUMNS)
+
+def convert_csv_to_parquet(csv_path: str) -> str:
+    """
+    Convert the vendor CSV into a columnar Parquet copy with categorical dtypes.
+    
+    The file is written to a temporary path and moved into place, so concurrent
+    workers never read a partially written cache.
+    
+    Args:
+        csv_path (str): Path to the CSV file containing vendor data
+        
+    Returns:
+        str: Path to the Parquet file
+    """
+    parquet_path = parquet_cache_path(csv_path)
+    df = read_vendor_csv(csv_path)
+    
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    return parquet_path
+
+def ensure_parquet_cache(csv_path: str) -> str:
+    """
+    Make sure the Parquet copy of a CSV exists and is not older than the CSV.
+    
+    Args:
+        csv_path (str): Path to the CSV file containing vendor data
+        
+    Returns:
+        str: Path to the up-to-date Parquet file
+    """
+    parquet_path = parquet_cache_path(csv_path)
+    if (not os.path.exists(parquet_path)
+            or os.path.getmtime(parquet_path) < os.path.getmtime(csv_path)):
+        convert_csv_to_parquet(csv_path)
+    return parquet_path
 
 class DataLoader:
     def __init__(self, file_path: str):
@@ -11,8 +122,109 @@ class DataLoader:
             file_path (str): Path to the CSV file containing vendor data
         """
         self.file_path = file_path
-        self.data = pd.read_csv(file_path)
-        self.preprocessed_dataset = self.preprocess_data()
+        self.data = self._read_dataset(file_path)
+        self.preprocessed_dataset = to_categorical(
+            self.preprocess_data(), FEATURE_CATEGORICAL_COLUMNS, ordered_by_appearance=True
+        )
+        
+        # Map each product to its rating once so lookups in the request path are O(1);
+        # the first row per product wins, matching a filtered .iloc[0] lookup
+        first_rows = self.data.drop_duplicates(subset='product_name', keep='first')
+        self.product_rating: Dict[str, float] = dict(
+            zip(first_rows['product_name'], first_rows['rating'].fillna(0.0))
+        )
+        
+        # Lower-cased category -> row positions, so category filters only scan the
+        # handful of distinct categories instead of every row
+        self._category_positions = {
+            'data': self._index_categories(self.data),
+            'preprocessed_dataset': self._index_categories(self.preprocessed_dataset)
+        }
+        
+        # Exact value -> row positions in the preprocessed frame for the lookup
+        # columns, so per-call lookups are a dict get instead of a full scan
+        self._row_positions = {
+            column: self.preprocessed_dataset.groupby(column, observed=True, sort=False).indices
+            for column in ['main_category', 'product_name', 'Feature_name']
+        }
+
+    @staticmethod
+    def _read_dataset(file_path: str) -> pd.DataFrame:
+        """
+        Read the vendor data, preferring an up-to-date Parquet copy of a CSV.
+        
+        Parquet loads much faster than CSV and keeps the categorical dtypes. The
+        copy is created on first use; if that fails (e.g. no Parquet engine, a
+        read-only data directory or an unreadable copy) the CSV is read directly.
+        
+        Args:
+            file_path (str): Path to a CSV or Parquet file
+            
+        Returns:
+            pd.DataFrame: Raw vendor data
+        """
+        if file_path.endswith('.parquet'):
+            return pd.read_parquet(file_path)
+        
+        try:
+            return pd.read_parquet(ensure_parquet_cache(file_path))
+        except (ImportError, OSError, ValueError) as e:
+            logger.warning(f"Parquet cache unavailable, reading CSV directly: {e}")
+            return read_vendor_csv(file_path)
+
+    @staticmethod
+    def _index_categories(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Group row positions by lower-cased main category.
+        
+        Args:
+            df (pd.DataFrame): Frame with a main_category column
+            
+        Returns:
+            Dict[str, np.ndarray]: Row positions for each lower-cased category
+        """
+        lowered = df['main_category'].str.lower().to_numpy()
+        return pd.Series(lowered).groupby(lowered).indices
+
+    def filter_by_category(self, category: str, dataset: str = 'data') -> pd.DataFrame:
+        """
+        Filter rows whose main category contains the given text, ignoring case.
+        
+        Args:
+            category (str): Category text to search for
+            dataset (str): Which frame to filter, 'data' or 'preprocessed_dataset'
+            
+        Returns:
+            pd.DataFrame: Matching rows in their original order
+        """
+        df = getattr(self, dataset)
+        needle = category.lower()
+        positions = [
+            rows for name, rows in self._category_positions[dataset].items()
+            if needle in name
+        ]
+        if not positions:
+            return df.iloc[0:0]
+        return df.iloc[np.sort(np.concatenate(positions))]
+
+    def _rows_with_values(self, column: str, values: List[Any]) -> pd.DataFrame:
+        """
+        Select preprocessed rows whose column equals any of the given values.
+        
+        Args:
+            column (str): Indexed column name
+            values (List[Any]): Values to look up
+            
+        Returns:
+            pd.DataFrame: Matching rows in their original order
+        """
+        positions = [
+            self._row_positions[column][value] for value in set(values)
+            if value in self._row_positions[column]
+        ]
+        if not positions:
+            return self.preprocessed_dataset.iloc[0:0]
+        return self.preprocessed_dataset.iloc[np.sort(np.concatenate(positions))]
 
     def preprocess_data(self) -> pd.DataFrame:
         """
@@ -21,9 +233,6 @@ class DataLoader:
         Returns:
             pd.DataFrame: Processed vendor data
         """
-        # Create a copy to avoid modifying original data
-        df = self.data.copy()
-        
         # Drop columns that exist in the dataset (handle missing columns gracefully)
         columns_to_drop = [
             'ownership', 'total_revenue', 'highest_rated_features', 'lowest_rated_features', 
@@ -32,71 +241,77 @@ class DataLoader:
             'competitors', 'official_downloads'
         ]
         
-        # Only drop columns that actually exist
-        existing_columns_to_drop = [col for col in columns_to_drop if col in df.columns]
-        df = df.drop(columns=existing_columns_to_drop)
+        # Only drop columns that actually exist; drop returns a new frame, so the
+        # column assignments below never touch self.data
+        existing_columns_to_drop = [col for col in columns_to_drop if col in self.data.columns]
+        df = self.data.drop(columns=existing_columns_to_drop)
         
-        # Process Features column - handle NaN values properly
+        # Process Features column in a single pass - missing values (NaN) and
+        # invalid JSON both fail json.loads and become None
         def safe_json_parse(x):
-            if pd.isna(x) or x is None:
+            try:
+                return json.loads(x)
+            except (TypeError, ValueError):
                 return None
-            if isinstance(x, str):
-                try:
-                    return json.loads(x)
-                except json.JSONDecodeError:
-                    return None
-            return None
         
-        df['Features'] = df['Features'].apply(safe_json_parse)
+        df['Features'] = [safe_json_parse(x) for x in df['Features'].to_numpy()]
         
         # Filter out rows with no features for exploding
-        df_with_features = df[df['Features'].notna()].copy()
-        df_without_features = df[df['Features'].isna()].copy()
+        df_with_features = df[df['Features'].notna()]
         
         if len(df_with_features) == 0:
-            # If no features data, return original df with additional columns
-            df['Features_Category'] = None
-            df['Feature_name'] = None
-            df['Feature_description'] = None
-            df['Feature_percent'] = None
-            df['Feature_review'] = None
-            return df.drop(columns=['Features'])
-        
-        # Explode the Features column (each category becomes a row)
-        df_exploded = df_with_features.explode('Features').reset_index(drop=True)
-        
-        # Extract category information
-        df_exploded['Features_Category'] = df_exploded['Features'].apply(
-            lambda x: x.get('Category', None) if isinstance(x, dict) else None
-        )
-        df_exploded['Features_list'] = df_exploded['Features'].apply(
-            lambda x: x.get('features', []) if isinstance(x, dict) else []
-        )
+            # If no features data, return original df with additional columns,
+            # added in one assign rather than one insert per column
+            return df.drop(columns=['Features']).assign(
+                Features_Category=None,
+                Feature_name=None,
+                Feature_description=None,
+                Feature_percent=None,
+                Feature_review=None
+            )
         
-        # Drop the original Features column
-        df_exploded = df_exploded.drop(columns=['Features'])
+        # Flatten both levels (feature categories, then the features within each)
+        # in one pass, recording which source row every feature row came from
+        parent_rows = []
+        categories = []
+        descriptions = []
+        names = []
+        percents = []
+        reviews = []
+        for row_idx, features in enumerate(df_with_features['Features'].to_numpy()):
+            for category_entry in _explode_values(features):
+                if isinstance(category_entry, dict):
+                    category = category_entry.get('Category', None)
+                    feature_list = category_entry.get('features', [])
+                else:
+                    category = None
+                    feature_list = []
+                
+                for feature in _explode_values(feature_list):
+                    parent_rows.append(row_idx)
+                    categories.append(category)
+                    if isinstance(feature, dict):
+                        descriptions.append(feature.get('description', ''))
+                        names.append(feature.get('name', ''))
+                        percents.append(feature.get('percent', 0))
+                        reviews.append(feature.get('review', 0))
+                    else:
+                        descriptions.append('')
+                        names.append('')
+                        percents.append(0)
+                        reviews.append(0)
         
-        # Explode the features list (each feature becomes a row)
-        df_exploded2 = df_exploded.explode('Features_list').reset_index(drop=True)
+        # Gather the vendor columns once per feature row and attach the flat columns
+        df_flat = df_with_features.drop(columns=['Features']).iloc[
+            np.asarray(parent_rows, dtype=np.intp)
+        ].reset_index(drop=True)
+        df_flat['Features_Category'] = categories
+        df_flat['Feature_description'] = descriptions
+        df_flat['Feature_name'] = names
+        df_flat['Feature_percent'] = percents
+        df_flat['Feature_review'] = reviews
         
-        # Extract individual feature information
-        df_exploded2['Feature_description'] = df_exploded2['Features_list'].apply(
-            lambda x: x.get('description', '') if isinstance(x, dict) else ''
-        )
-        df_exploded2['Feature_name'] = df_exploded2['Features_list'].apply(
-            lambda x: x.get('name', '') if isinstance(x, dict) else ''
-        ) 
-        df_exploded2['Feature_percent'] = df_exploded2['Features_list'].apply(
-            lambda x: x.get('percent', 0) if isinstance(x, dict) else 0
-        )
-        df_exploded2['Feature_review'] = df_exploded2['Features_list'].apply(
-            lambda x: x.get('review', 0) if isinstance(x, dict) else 0
-        )
-        
-        # Drop the Features_list column
-        df_exploded2 = df_exploded2.drop(columns=['Features_list'])
-        
-        return df_exploded2
+        return df_flat
 
     def get_vendors_by_category(self, category: str) -> pd.DataFrame:
         """
@@ -108,9 +323,7 @@ class DataLoader:
         Returns:
             pd.DataFrame: Filtered vendor data
         """
-        return self.preprocessed_dataset[
-            self.preprocessed_dataset['main_category'] == category
-        ]
+        return self._rows_with_values('main_category', [category])
 
     def get_vendor_features(self, vendor_name: str) -> List[str]:
         """
@@ -122,9 +335,7 @@ class DataLoader:
         Returns:
             List[str]: List of vendor features
         """
-        vendor_data = self.preprocessed_dataset[
-            self.preprocessed_dataset['product_name'] == vendor_name
-        ]
+        vendor_data = self._rows_with_values('product_name', [vendor_name])
         return vendor_data['Feature_name'].dropna().tolist()
 
     def get_vendors_by_features(self, features: List[str]) -> pd.DataFrame:
@@ -137,7 +348,5 @@ class DataLoader:
         Returns:
             pd.DataFrame: Filtered vendor data
         """
-        return self.preprocessed_dataset[
-            self.preprocessed_dataset['Feature_name'].isin(features)
-        ]
+        return self._rows_with_values('Feature_name', features)
     
\ No newline at end of file
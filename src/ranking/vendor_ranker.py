@@ -1,5 +1,6 @@
 from typing import List, Dict, Any
 import numpy as np
+import pandas as pd
 import logging
 
 class VendorRanker:
@@ -54,6 +55,43 @@ class VendorRanker:
         
         return final_score
 
+    def compute_rank_scores(self, vendors: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Compute rank scores for many vendors at once.
+        
+        Vectorized equivalent of compute_rank_score using each vendor's average
+        similarity score.
+        
+        Args:
+            vendors (List[Dict[str, Any]]): Vendor information including rating and similarity data
+            
+        Returns:
+            np.ndarray: Rank score per vendor, in input order
+        """
+        sim_scores = np.fromiter(
+            (vendor.get('avg_similarity_score', 0.0) for vendor in vendors),
+            dtype=float,
+            count=len(vendors)
+        )
+        
+        # Ratings may arrive as strings; anything unparseable counts as 0
+        ratings = pd.to_numeric(
+            pd.Series([vendor.get('rating', 0.0) for vendor in vendors], dtype=object),
+            errors='coerce'
+        ).fillna(0.0).to_numpy(dtype=float, copy=True)
+        
+        # Clip and weight both arrays in place, then sum into the similarity
+        # buffer, so scoring allocates no temporaries beyond the two inputs
+        np.clip(sim_scores, 0.0, 1.0, out=sim_scores)
+        sim_scores *= self.feature_weight
+        
+        ratings /= 5.0
+        np.clip(ratings, 0.0, 1.0, out=ratings)
+        ratings *= self.rating_weight
+        
+        sim_scores += ratings
+        return sim_scores
+
     def rank_vendors(self, vendors_dict: Dict[str, Dict[str, Any]], top_n: int = 10) -> List[Dict[str, Any]]:
         """
         Rank vendors based on similarity scores and ratings.
@@ -68,34 +106,39 @@ class VendorRanker:
         if not vendors_dict:
             return []
         
-        ranked_vendors = []
-        
-        for vendor_key, vendor_data in vendors_dict.items():
-            # Compute rank score
-            rank_score = self.compute_rank_score(vendor_data)
-            
-            # Create vendor result with ranking information
-            vendor_result = {
+        vendor_items = list(vendors_dict.items())
+        scores = self.compute_rank_scores([vendor_data for _, vendor_data in vendor_items])
+        
+        # Select the top N without sorting every vendor: keep everything scoring at
+        # least the Nth best score, then stable-sort just those so ties keep their
+        # original order exactly as a full sort would
+        top_count = max(0, min(top_n, len(scores)))
+        if top_count == 0:
+            candidates = np.array([], dtype=int)
+        elif top_count < len(scores):
+            cutoff = np.partition(scores, len(scores) - top_count)[len(scores) - top_count]
+            candidates = np.flatnonzero(scores >= cutoff)
+        else:
+            candidates = np.arange(len(scores))
+        order = candidates[np.argsort(-scores[candidates], kind='stable')][:top_count]
+        
+        # Create result dicts only for the vendors being returned
+        top_vendors = []
+        for idx in order:
+            vendor_key, vendor_data = vendor_items[idx]
+            top_vendors.append({
                 'vendor_key': vendor_key,
                 'product_name': vendor_data.get('product_name', ''),
                 'vendor': vendor_data.get('vendor', ''),
                 'main_category': vendor_data.get('main_category', ''),
-                'rank_score': rank_score,
+                'rank_score': float(scores[idx]),
                 'max_similarity_score': vendor_data.get('max_similarity_score', 0.0),
                 'avg_similarity_score': vendor_data.get('avg_similarity_score', 0.0),
                 'total_matches': vendor_data.get('total_matches', 0),
                 'matched_capabilities': vendor_data.get('matched_capabilities', []),
                 'matching_features': vendor_data.get('matching_features', []),
                 'rating': vendor_data.get('rating', 0.0)
-            }
-            
-            ranked_vendors.append(vendor_result)
-        
-        # Sort by rank score (descending)
-        ranked_vendors.sort(key=lambda x: x['rank_score'], reverse=True)
-        
-        # Return top N vendors
-        top_vendors = ranked_vendors[:top_n]
+            })
         
         self.logger.info(f"Ranked {len(vendors_dict)} vendors, returning top {len(top_vendors)}")
         
@@ -1,26 +1,76 @@
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import heapq
+import os
+import pickle
+from functools import lru_cache
 import numpy as np
 import pandas as pd
-from sklearn.feature_extraction.text import TfidfVectorizer
+import sklearn
+from sklearn.base import clone
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer, TfidfVectorizer
+from sklearn.pipeline import make_pipeline
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
 import logging
 
+# Match fields copied into each vendor's matching_features entries
+MATCHING_FEATURE_KEYS = [
+    'feature_category',
+    'feature_name',
+    'feature_description',
+    'feature_percent',
+    'feature_review_count',
+    'matched_capability',
+    'similarity_score'
+]
+
 class FeatureMatcher:
-    def __init__(self, similarity_threshold: float = 0.5):
+    def __init__(self, similarity_threshold: float = 0.5, use_hashing: bool = False,
+                 dtype: type = np.float64):
         """
         Initialize the FeatureMatcher with a similarity threshold.
         
         Args:
             similarity_threshold (float): Minimum similarity score to consider features as matching
+            use_hashing (bool): Hash terms instead of keeping a vocabulary; no vocabulary dict
+                is built, but terms unseen in the corpus still count against a capability
+            dtype (type): Float type of the TF-IDF vectors and scores; np.float32 halves the
+                matrix memory at the cost of scores differing in the last few digits
         """
         self.similarity_threshold = similarity_threshold
-        self.vectorizer = TfidfVectorizer(
-            stop_words='english',
-            lowercase=True,
-            max_features=5000,
-            ngram_range=(1, 2)  # Include both unigrams and bigrams
-        )
+        if use_hashing:
+            self.vectorizer = make_pipeline(
+                HashingVectorizer(
+                    stop_words='english',
+                    lowercase=True,
+                    n_features=2 ** 18,
+                    ngram_range=(1, 2),
+                    alternate_sign=False,
+                    norm=None,  # TfidfTransformer normalizes after weighting
+                    dtype=dtype
+                ),
+                TfidfTransformer()
+            )
+        else:
+            self.vectorizer = TfidfVectorizer(
+                stop_words='english',
+                lowercase=True,
+                max_features=5000,
+                ngram_range=(1, 2),  # Include both unigrams and bigrams
+                dtype=dtype
+            )
         self.logger = logging.getLogger(__name__)
+        
+        # Corpus state set by fit(); None until the matcher has been fitted
+        self._fitted_vectorizer = None
+        self._fitted_frame = None
+        self._fitted_index = None
+        self._feature_matrix = None
+        self._feature_inverse = None
+        self._cached_filter = None
+        self._cached_category_rows = None
+        self._category_positions = None
 
     def _prepare_feature_text(self, feature_name: str, feature_description: str) -> str:
         """
@@ -41,6 +91,162 @@ class FeatureMatcher:
         combined_text = f"{name} {name} {desc}".strip() 
         return combined_text if combined_text else "unknown feature"
 
+    @staticmethod
+    def _column_values(features_df: pd.DataFrame, column: str, default: Any) -> List[Any]:
+        """
+        Get a column as a list of Python values, or the default for every row if it is missing.
+        
+        Args:
+            features_df (pd.DataFrame): DataFrame with feature information
+            column (str): Column name
+            default (Any): Value used when the column does not exist
+            
+        Returns:
+            List[Any]: One value per row
+        """
+        if column not in features_df.columns:
+            return [default] * len(features_df)
+        return features_df[column].tolist()
+
+    @staticmethod
+    def _text_column(features_df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Get a column as strings, with the values _prepare_feature_text treats as empty blanked out.
+        
+        Args:
+            features_df (pd.DataFrame): DataFrame with feature information
+            column (str): Column name
+            
+        Returns:
+            pd.Series: String values, '' for missing, falsy or 'nan' entries
+        """
+        if column not in features_df.columns:
+            return pd.Series('', index=features_df.index)
+        
+        values = features_df[column].astype(object)
+        text = values.where(values.notna() & values.astype(bool), '').astype(str)
+        return text.mask(text == 'nan', '')
+
+    def _build_feature_texts(self, features_df: pd.DataFrame) -> List[str]:
+        """
+        Build the text representation of every feature row in a DataFrame.
+        
+        Args:
+            features_df (pd.DataFrame): DataFrame with feature information
+            
+        Returns:
+            List[str]: One combined feature text per row
+        """
+        # Same text as _prepare_feature_text, built for the whole column at once
+        name = self._text_column(features_df, 'Feature_name')
+        desc = self._text_column(features_df, 'Feature_description')
+        combined = (name + ' ' + name + ' ' + desc).str.strip()
+        return combined.mask(combined == '', 'unknown feature').tolist()
+
+    def _fit_tfidf(self, feature_texts: List[str]) -> Tuple[Any, Any, np.ndarray]:
+        """
+        Fit a copy of the vectorizer and build the normalized matrix of distinct texts.
+        
+        Returns:
+            Tuple: (fitted vectorizer, CSR matrix of distinct texts, row -> distinct text positions)
+        """
+        vectorizer = clone(self.vectorizer)
+        # IDF weights come from every row, duplicates included, but each distinct
+        # text is vectorized and scored only once; rows map to it via the inverse
+        vectorizer.fit(feature_texts)
+        unique_texts, inverse = np.unique(np.asarray(feature_texts, dtype=object), return_inverse=True)
+        
+        # Rows are L2-normalized once here so query similarity is a sparse dot product
+        feature_matrix = normalize(vectorizer.transform(unique_texts.tolist()), copy=False).tocsr()
+        return vectorizer, feature_matrix, inverse
+
+    def _fit_tfidf_cached(self, feature_texts: List[str], cache_dir: str) -> Tuple[Any, Any, np.ndarray]:
+        """
+        _fit_tfidf backed by a pickle in cache_dir keyed on the corpus and vectorizer.
+        
+        The key hashes the feature texts, the vectorizer configuration and the
+        scikit-learn version, so any change to them fits (and caches) afresh.
+        A missing, unreadable or unwritable cache falls back to fitting.
+        """
+        digest = hashlib.sha256(f"{sklearn.__version__}\0{self.vectorizer!r}\0".encode())
+        digest.update('\0'.join(feature_texts).encode())
+        cache_path = os.path.join(cache_dir, f"tfidf_{digest.hexdigest()[:32]}.pkl")
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+        
+        fitted = self._fit_tfidf(feature_texts)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(fitted, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not cache the TF-IDF fit: {e}")
+        return fitted
+
+    def fit(self, features_df: pd.DataFrame, cache_dir: Optional[str] = None) -> 'FeatureMatcher':
+        """
+        Fit the TF-IDF vocabulary once over a feature corpus and keep its matrix.
+        
+        Queries against this DataFrame (or rows selected from it) then only
+        transform the capabilities instead of refitting on every call. The fitted
+        state is read-only afterwards, so it is safe to share across threads.
+        
+        Args:
+            features_df (pd.DataFrame): Preprocessed feature DataFrame with a unique index
+            cache_dir (str, optional): Directory to persist the fit in and reuse it
+                from when the same corpus is fitted again
+            
+        Returns:
+            FeatureMatcher: self, fitted
+        """
+        if not features_df.index.is_unique:
+            raise ValueError("DataFrame index must be unique to fit the feature matrix")
+        
+        feature_texts = self._build_feature_texts(features_df)
+        if cache_dir is None:
+            vectorizer, feature_matrix, inverse = self._fit_tfidf(feature_texts)
+        else:
+            vectorizer, feature_matrix, inverse = self._fit_tfidf_cached(feature_texts, cache_dir)
+        
+        self._fitted_vectorizer = vectorizer
+        self._feature_matrix = feature_matrix
+        self._feature_inverse = inverse
+        self._fitted_index = features_df.index
+        self._fitted_frame = features_df
+        # Category -> row positions, so category queries select rows by integer
+        # position instead of comparing strings row by row
+        self._category_positions = features_df.groupby('main_category', observed=True, sort=False).indices
+        
+        # Results are only valid for this corpus, so a refit starts fresh caches;
+        # category subsets are shared by every query on the same category
+        self._cached_filter = lru_cache(maxsize=256)(self._filter_fitted)
+        self._cached_category_rows = lru_cache(maxsize=64)(self._category_rows_fitted)
+        
+        self.logger.info(f"Fitted TF-IDF over {len(feature_texts)} features "
+                         f"({feature_matrix.shape[0]} distinct, {feature_matrix.shape[1]} terms)")
+        return self
+
+    def _fitted_rows(self, dataframe: pd.DataFrame, features_df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Map rows selected from the fitted DataFrame to rows of the fitted matrix.
+        
+        Args:
+            dataframe (pd.DataFrame): DataFrame the rows were selected from
+            features_df (pd.DataFrame): Selected rows
+            
+        Returns:
+            Optional[np.ndarray]: Matrix row positions, or None if dataframe is not the fitted one
+        """
+        if self._fitted_frame is None or dataframe is not self._fitted_frame:
+            return None
+        return self._fitted_index.get_indexer(features_df.index)
+
     def compute_similarity_matrix(self, capabilities: List[str], feature_texts: List[str]) -> np.ndarray:
         """
         Compute similarity matrix between capabilities and feature texts.
@@ -59,8 +265,10 @@ class FeatureMatcher:
         all_texts = capabilities + feature_texts
         
         try:
-            # Fit and transform all texts
-            tfidf_matrix = self.vectorizer.fit_transform(all_texts)
+            # Fit a fresh copy of the configured vectorizer so concurrent requests
+            # never share fitted state
+            vectorizer = clone(self.vectorizer)
+            tfidf_matrix = vectorizer.fit_transform(all_texts)
             
             # Split back into capabilities and features
             capability_vectors = tfidf_matrix[:len(capabilities)]
@@ -75,15 +283,55 @@ class FeatureMatcher:
             self.logger.error(f"Error computing similarity matrix: {e}")
             return np.zeros((len(capabilities), len(feature_texts)))
 
+    def compute_fitted_similarity_matrix(self, capabilities: List[str], feature_rows: np.ndarray) -> np.ndarray:
+        """
+        Compute similarity between capabilities and rows of the fitted feature matrix.
+        
+        Args:
+            capabilities (List[str]): List of desired capabilities
+            feature_rows (np.ndarray): Row positions in the fitted feature matrix
+            
+        Returns:
+            np.ndarray: Similarity matrix of shape (len(capabilities), len(feature_rows))
+        """
+        if not capabilities or len(feature_rows) == 0:
+            return np.array([])
+        
+        try:
+            capability_vectors = normalize(self._fitted_vectorizer.transform(capabilities), copy=False)
+            
+            # Score each distinct text once, then spread the scores back to the rows
+            text_rows = self._feature_inverse[feature_rows]
+            if len(feature_rows) == len(self._feature_inverse):
+                # Whole corpus: every distinct text is needed, skip the gather
+                feature_vectors, columns = self._feature_matrix, text_rows
+            else:
+                needed, columns = np.unique(text_rows, return_inverse=True)
+                feature_vectors = self._feature_matrix[needed]
+            
+            # Cosine similarity of normalized sparse rows, multiplying only non-zero terms
+            return (capability_vectors @ feature_vectors.T).toarray()[:, columns]
+            
+        except Exception as e:
+            self.logger.error(f"Error computing similarity matrix: {e}")
+            return np.zeros((len(capabilities), len(feature_rows)))
+
     def find_matching_features(self, 
                              capabilities: List[str], 
-                             features_df: pd.DataFrame) -> List[Dict[str, Any]]:
+                             features_df: pd.DataFrame,
+                             similarity_threshold: Optional[float] = None,
+                             feature_rows: Optional[np.ndarray] = None,
+                             top_k_matches: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Find features that match the given capabilities above the similarity threshold.
         
         Args:
             capabilities (List[str]): List of desired capabilities
             features_df (pd.DataFrame): DataFrame with feature information
+            similarity_threshold (float, optional): Per-call threshold override
+            feature_rows (np.ndarray, optional): Positions of features_df's rows in the
+                fitted feature matrix; when given, the vectorizer is not refitted
+            top_k_matches (int, optional): Return only the best K matches; None returns all
             
         Returns:
             List[Dict[str, Any]]: List of matching features with similarity scores
@@ -91,47 +339,66 @@ class FeatureMatcher:
         if features_df.empty or not capabilities:
             return []
         
-        # Prepare feature texts for similarity computation
-        feature_texts = []
-        for _, row in features_df.iterrows():
-            feature_text = self._prepare_feature_text(
-                row.get('Feature_name', ''), 
-                row.get('Feature_description', '')
-            )
-            feature_texts.append(feature_text)
+        threshold = self.similarity_threshold if similarity_threshold is None else similarity_threshold
         
-        # Compute similarity matrix
-        similarity_matrix = self.compute_similarity_matrix(capabilities, feature_texts)
+        if feature_rows is not None:
+            # Reuse the corpus fitted up front; only the capabilities are transformed
+            similarity_matrix = self.compute_fitted_similarity_matrix(capabilities, feature_rows)
+        else:
+            # Prepare feature texts and fit the vectorizer for this call only
+            feature_texts = self._build_feature_texts(features_df)
+            similarity_matrix = self.compute_similarity_matrix(capabilities, feature_texts)
         
         if similarity_matrix.size == 0:
             return []
         
-        # Find matches above threshold
-        matches = []
-        for cap_idx, capability in enumerate(capabilities):
-            for feat_idx, (_, feature_row) in enumerate(features_df.iterrows()):
-                similarity_score = similarity_matrix[cap_idx, feat_idx]
-                
-                if similarity_score >= self.similarity_threshold:
-                    match = {
-                        'product_name': feature_row.get('product_name', ''),
-                        'vendor': feature_row.get('seller', ''),
-                        'main_category': feature_row.get('main_category', ''),
-                        'feature_category': feature_row.get('Features_Category', ''),
-                        'feature_name': feature_row.get('Feature_name', ''),
-                        'feature_description': feature_row.get('Feature_description', ''),
-                        'feature_percent': feature_row.get('Feature_percent', 0),
-                        'feature_review_count': feature_row.get('Feature_review', 0),
-                        'matched_capability': capability,
-                        'similarity_score': float(similarity_score),
-                        'feature_text': feature_texts[feat_idx]
-                    }
-                    matches.append(match)
-        
-        # Sort by similarity score (descending)
-        matches.sort(key=lambda x: x['similarity_score'], reverse=True)
-        
-        self.logger.info(f"Found {len(matches)} feature matches above threshold {self.similarity_threshold}")
+        # Find (capability, feature) pairs above threshold, in row-major order
+        cap_idxs, feat_idxs = np.nonzero(similarity_matrix >= threshold)
+        pair_scores = similarity_matrix[cap_idxs, feat_idxs]
+        total_found = len(pair_scores)
+        
+        # Order pairs by similarity score (descending) before building any dicts;
+        # both orderings are stable, so tied pairs keep their row-major order
+        if top_k_matches is not None:
+            order = heapq.nlargest(top_k_matches, range(total_found), key=pair_scores.__getitem__)
+        else:
+            order = np.argsort(-pair_scores, kind='stable')
+        cap_idxs, feat_idxs = cap_idxs[order], feat_idxs[order]
+        scores = pair_scores[order].tolist()
+        
+        # Gather only the matched rows, one column at a time
+        matched_rows = features_df.iloc[feat_idxs]
+        columns = {
+            key: self._column_values(matched_rows, column, default)
+            for key, column, default in [
+                ('product_name', 'product_name', ''),
+                ('vendor', 'seller', ''),
+                ('main_category', 'main_category', ''),
+                ('feature_category', 'Features_Category', ''),
+                ('feature_name', 'Feature_name', ''),
+                ('feature_description', 'Feature_description', ''),
+                ('feature_percent', 'Feature_percent', 0),
+                ('feature_review_count', 'Feature_review', 0),
+            ]
+        }
+        
+        matches = [
+            {
+                'product_name': columns['product_name'][i],
+                'vendor': columns['vendor'][i],
+                'main_category': columns['main_category'][i],
+                'feature_category': columns['feature_category'][i],
+                'feature_name': columns['feature_name'][i],
+                'feature_description': columns['feature_description'][i],
+                'feature_percent': columns['feature_percent'][i],
+                'feature_review_count': columns['feature_review_count'][i],
+                'matched_capability': capabilities[cap_idx],
+                'similarity_score': scores[i]
+            }
+            for i, cap_idx in enumerate(cap_idxs.tolist())
+        ]
+        
+        self.logger.info(f"Found {total_found} feature matches above threshold {threshold}")
         return matches
 
     def select_matching_vendors(self, matches: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
@@ -146,54 +413,79 @@ class FeatureMatcher:
         """
         vendors = {}
         
+        # Single pass: statistics are accumulated as running values, and matched
+        # capabilities go into an insertion-ordered dict used as an ordered set
         for match in matches:
             vendor_key = f"{match['product_name']}_{match['vendor']}"
+            score = match['similarity_score']
             
-            if vendor_key not in vendors:
-                vendors[vendor_key] = {
+            vendor_data = vendors.get(vendor_key)
+            if vendor_data is None:
+                vendor_data = vendors[vendor_key] = {
                     'product_name': match['product_name'],
                     'vendor': match['vendor'],
                     'main_category': match['main_category'],
                     'matching_features': [],
-                    'matched_capabilities': set(),
+                    'matched_capabilities': {},
                     'max_similarity_score': 0.0,
                     'avg_similarity_score': 0.0,
-                    'total_matches': 0
+                    'total_matches': 0,
+                    '_sum_similarity': 0.0
                 }
             
-            # Add this feature match
-            vendors[vendor_key]['matching_features'].append({
-                'feature_category': match['feature_category'],
-                'feature_name': match['feature_name'],
-                'feature_description': match['feature_description'],
-                'feature_percent': match['feature_percent'],
-                'feature_review_count': match['feature_review_count'],
-                'matched_capability': match['matched_capability'],
-                'similarity_score': match['similarity_score']
-            })
-            
-            # Update vendor-level statistics
-            vendors[vendor_key]['matched_capabilities'].add(match['matched_capability'])
-            vendors[vendor_key]['max_similarity_score'] = max(
-                vendors[vendor_key]['max_similarity_score'], 
-                match['similarity_score']
-            )
-            vendors[vendor_key]['total_matches'] += 1
+            vendor_data['matching_features'].append({key: match[key] for key in MATCHING_FEATURE_KEYS})
+            vendor_data['matched_capabilities'][match['matched_capability']] = None
+            if score > vendor_data['max_similarity_score']:
+                vendor_data['max_similarity_score'] = score
+            vendor_data['_sum_similarity'] += score
+            vendor_data['total_matches'] += 1
         
-        # Calculate average similarity scores
         for vendor_data in vendors.values():
-            if vendor_data['total_matches'] > 0:
-                avg_score = sum(f['similarity_score'] for f in vendor_data['matching_features']) / vendor_data['total_matches']
-                vendor_data['avg_similarity_score'] = avg_score
-                vendor_data['matched_capabilities'] = list(vendor_data['matched_capabilities'])
+            vendor_data['avg_similarity_score'] = vendor_data.pop('_sum_similarity') / vendor_data['total_matches']
+            vendor_data['matched_capabilities'] = list(vendor_data['matched_capabilities'])
         
         self.logger.info(f"Selected {len(vendors)} vendors with matching features")
         return vendors
 
+    @staticmethod
+    def _category_mask(categories: pd.Series, software_category: str) -> pd.Series:
+        """
+        Mark rows whose category contains software_category, ignoring case.
+        
+        The text is only matched against the distinct categories, and rows are
+        then selected by membership, which for categoricals compares integer codes.
+        
+        Args:
+            categories (pd.Series): main_category column
+            software_category (str): Category text, matched literally
+            
+        Returns:
+            pd.Series: Boolean mask aligned with categories
+        """
+        if isinstance(categories.dtype, pd.CategoricalDtype):
+            distinct = pd.Series(categories.cat.categories)
+        else:
+            distinct = pd.Series(categories.dropna().unique())
+        
+        return categories.isin(FeatureMatcher._matching_categories(distinct, software_category))
+
+    @staticmethod
+    def _matching_categories(distinct: pd.Series, software_category: str) -> pd.Series:
+        """
+        Distinct categories containing software_category, ignoring case.
+        
+        A literal lower-cased substring match, the same rule as
+        DataLoader.filter_by_category, so every endpoint selects the same rows.
+        """
+        lowered = distinct.astype(str).str.lower()
+        return distinct[lowered.str.contains(software_category.lower(), regex=False) & distinct.notna()]
+
     def filter_vendors_by_category_and_capabilities(self, 
                                                   dataframe: pd.DataFrame, 
                                                   software_category: str, 
-                                                  capabilities: List[str]) -> Dict[str, Any]:
+                                                  capabilities: List[str],
+                                                  similarity_threshold: Optional[float] = None,
+                                                  max_raw_matches: Optional[int] = None) -> Dict[str, Any]:
         """
         Main method to filter vendors by category and find those matching desired capabilities.
         
@@ -201,19 +493,52 @@ class FeatureMatcher:
             dataframe (pd.DataFrame): Input dataframe containing vendor data
             software_category (str): Software category to filter by
             capabilities (List[str]): List of desired capabilities
+            similarity_threshold (float, optional): Per-call threshold override, so
+                callers sharing one matcher do not have to mutate its state
+            max_raw_matches (int, optional): Keep only the top N raw matches in the
+                results (all are still used for vendor selection); None keeps all
             
         Returns:
-            Dict[str, Any]: Results containing matching vendors and statistics
+            Dict[str, Any]: Results containing matching vendors and statistics; results
+                for the fitted DataFrame come from a shared cache and must be treated
+                as read-only
+        """
+        threshold = self.similarity_threshold if similarity_threshold is None else similarity_threshold
+        
+        if self._cached_filter is not None and dataframe is self._fitted_frame:
+            # Repeated queries against the fitted corpus are served from the cache.
+            # The results are shared between callers, who must not modify them.
+            return self._cached_filter(software_category, tuple(capabilities), threshold, max_raw_matches)
+        
+        return self._filter_vendors(dataframe, software_category, capabilities, threshold, max_raw_matches)
+
+    def _filter_fitted(self,
+                       software_category: str,
+                       capabilities: Tuple[str, ...],
+                       similarity_threshold: float,
+                       max_raw_matches: Optional[int]) -> Dict[str, Any]:
+        """
+        Filter the fitted DataFrame; wrapped in an LRU cache by fit().
+        """
+        return self._filter_vendors(self._fitted_frame, software_category, list(capabilities),
+                                    similarity_threshold, max_raw_matches)
+
+    def _filter_vendors(self,
+                        dataframe: pd.DataFrame,
+                        software_category: str,
+                        capabilities: List[str],
+                        threshold: float,
+                        max_raw_matches: Optional[int]) -> Dict[str, Any]:
+        """
+        Run the category filter, feature matching and vendor selection for one query.
         """
         self.logger.info(f"Filtering vendors for category '{software_category}' with capabilities: {capabilities}")
         
         # Filter by category first
-        if software_category and software_category.lower() != 'all':
-            category_filtered = dataframe[
-                dataframe['main_category'].str.contains(software_category, case=False, na=False)
-            ]
+        if self._cached_category_rows is not None and dataframe is self._fitted_frame:
+            category_filtered = self._cached_category_rows(software_category)
         else:
-            category_filtered = dataframe.copy()
+            category_filtered = self._select_category(dataframe, software_category)
         
         self.logger.info(f"Found {len(category_filtered)} features in category '{software_category}'")
         
@@ -224,11 +549,12 @@ class FeatureMatcher:
                 'total_matches': 0,
                 'capabilities_searched': capabilities,
                 'category_searched': software_category,
-                'similarity_threshold': self.similarity_threshold
+                'similarity_threshold': threshold
             }
         
         # Find matching features
-        matches = self.find_matching_features(capabilities, category_filtered)
+        feature_rows = self._fitted_rows(dataframe, category_filtered)
+        matches = self.find_matching_features(capabilities, category_filtered, threshold, feature_rows)
         
         # Select matching vendors
         matching_vendors = self.select_matching_vendors(matches)
@@ -239,8 +565,100 @@ class FeatureMatcher:
             'total_matches': len(matches),
             'capabilities_searched': capabilities,
             'category_searched': software_category,
-            'similarity_threshold': self.similarity_threshold,
-            'raw_matches': matches  # Include for debugging/analysis
+            'similarity_threshold': threshold,
+            'raw_matches': matches if max_raw_matches is None else matches[:max_raw_matches]  # Include for debugging/analysis
+        }
+
+    def _select_category(self, dataframe: pd.DataFrame, software_category: str) -> pd.DataFrame:
+        """
+        Rows of dataframe in software_category ('all' or empty keeps every row).
+        """
+        if software_category and software_category.lower() != 'all':
+            return dataframe[self._category_mask(dataframe['main_category'], software_category)]
+        return dataframe.copy()
+
+    def _category_rows_fitted(self, software_category: str) -> pd.DataFrame:
+        """
+        Category rows of the fitted DataFrame; wrapped in an LRU cache by fit().
+        
+        Rows are gathered by the positions indexed at fit time, in frame order.
+        The subset is shared between queries, which only read from it.
+        """
+        if not software_category or software_category.lower() == 'all':
+            return self._select_category(self._fitted_frame, software_category)
+        
+        distinct = pd.Series(list(self._category_positions), dtype=object)
+        matched = self._matching_categories(distinct, software_category)
+        if matched.empty:
+            return self._fitted_frame.iloc[0:0]
+        
+        positions = np.sort(np.concatenate([self._category_positions[c] for c in matched]))
+        return self._fitted_frame.iloc[positions]
+
+    def apply_threshold(self, results: Dict[str, Any], similarity_threshold: float) -> Dict[str, Any]:
+        """
+        Narrow results computed at a lower threshold to a higher one without
+        recomputing similarity.
+        
+        Matches are sorted by score, so filtering them keeps the same order a
+        direct run at the higher threshold would produce.
+        
+        Args:
+            results (Dict[str, Any]): Output of filter_vendors_by_category_and_capabilities
+            similarity_threshold (float): Threshold to apply, not below the one used for results
+            
+        Returns:
+            Dict[str, Any]: Results as if computed directly at similarity_threshold
+        """
+        if 'raw_matches' not in results:
+            # Empty category: nothing was matched, only the threshold changes
+            return {**results, 'similarity_threshold': similarity_threshold}
+        
+        matches = [m for m in results['raw_matches'] if m['similarity_score'] >= similarity_threshold]
+        matching_vendors = self.select_matching_vendors(matches)
+        
+        return {
+            'matching_vendors': matching_vendors,
+            'total_vendors': len(matching_vendors),
+            'total_matches': len(matches),
+            'capabilities_searched': results['capabilities_searched'],
+            'category_searched': results['category_searched'],
+            'similarity_threshold': similarity_threshold,
+            'raw_matches': matches
+        }
+
+    def select_capabilities(self, results: Dict[str, Any], capabilities: List[str]) -> Dict[str, Any]:
+        """
+        Narrow results computed for a set of capabilities to a subset of them
+        without recomputing similarity.
+        
+        Each capability is scored independently, so the matches of the subset
+        are exactly those a direct run would find, in the same order as long as
+        capabilities keep their relative order from the original search.
+        
+        Args:
+            results (Dict[str, Any]): Output of filter_vendors_by_category_and_capabilities
+            capabilities (List[str]): Capabilities to keep, all among those searched
+            
+        Returns:
+            Dict[str, Any]: Results as if computed directly for capabilities
+        """
+        if 'raw_matches' not in results:
+            # Empty category: nothing was matched, only the capabilities change
+            return {**results, 'capabilities_searched': capabilities}
+        
+        wanted = set(capabilities)
+        matches = [m for m in results['raw_matches'] if m['matched_capability'] in wanted]
+        matching_vendors = self.select_matching_vendors(matches)
+        
+        return {
+            'matching_vendors': matching_vendors,
+            'total_vendors': len(matching_vendors),
+            'total_matches': len(matches),
+            'capabilities_searched': capabilities,
+            'category_searched': results['category_searched'],
+            'similarity_threshold': results['similarity_threshold'],
+            'raw_matches': matches
         }
 
     # old methods
@@ -0,0 +1,61 @@
+"""
+Warm-start cache of the DataLoader used by the tests.
+
+Every test process otherwise reads and preprocesses the CSV from scratch. The
+first process pickles its loader next to the runner's other caches; later ones
+load that pickle back, as long as neither the CSV nor the data loader module
+has changed since it was written.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import sys
+
+# Add parent directory to path to access src modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_processing import data_loader
+from src.data_processing.data_loader import DataLoader
+
+# Same directory run_tests.py keeps its dependency check marker in
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "vendor_qual_tests")
+
+# Persisted FeatureMatcher fits (see FeatureMatcher.fit's cache_dir)
+EMBEDDINGS_CACHE_DIR = os.path.join(CACHE_DIR, "embeddings")
+
+def cache_path(data_path):
+    """Pickle path for a data file, keyed on its location and the interpreter"""
+    digest = hashlib.sha1(f"{sys.executable}\0{os.path.abspath(data_path)}".encode())
+    return os.path.join(CACHE_DIR, f"loader_{digest.hexdigest()}.pkl")
+
+@functools.lru_cache(maxsize=None)
+def cached_loader(data_path):
+    """
+    DataLoader for data_path, loaded from the warm cache when it is fresh.
+
+    Memoized, so every test in a process shares one loader. Falls back to
+    building the loader (and refreshing the cache) when the pickle is missing,
+    stale or unreadable.
+    """
+    path = cache_path(data_path)
+    newest_source = max(os.path.getmtime(data_path), os.path.getmtime(data_loader.__file__))
+
+    try:
+        if os.path.getmtime(path) >= newest_source:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+    except Exception:
+        pass
+
+    loader = DataLoader(data_path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(loader, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return loader
@@ -0,0 +1,51 @@
+import pytest
+import sys
+import os
+
+# Add parent directory to path to access src modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from tests._warmcache import EMBEDDINGS_CACHE_DIR, cached_loader
+
+DATA_PATH = "data/G2 software - CRM Category Product Overviews.csv"
+
+@pytest.fixture(scope="session")
+def loader():
+    """DataLoader shared by every test in the session, loaded from the warm cache."""
+    return cached_loader(DATA_PATH)
+
+@pytest.fixture(scope="session")
+def matcher(loader):
+    """FeatureMatcher fitted once on the shared loader's corpus."""
+    import numpy as np
+    from src.similarity.feature_matcher import FeatureMatcher
+    matcher = FeatureMatcher(similarity_threshold=0.5, dtype=np.float32)
+    return matcher.fit(loader.preprocessed_dataset, cache_dir=EMBEDDINGS_CACHE_DIR)
+
+@pytest.fixture(scope="session")
+def matching_results(matcher, loader):
+    """Multi-capability CRM matches for the ranking test, computed once."""
+    return matcher.filter_vendors_by_category_and_capabilities(
+        dataframe=loader.preprocessed_dataset,
+        software_category="CRM Software",
+        capabilities=["Lead Management", "Email Marketing", "Contact Management"]
+    )
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    HTTP client for the API shared by every test in the session.
+    
+    Talks to the live server at TEST_API_BASE when it is set (by run_tests.py
+    or test_deployment.py), and to the app in-process otherwise.
+    """
+    base_url = os.environ.get("TEST_API_BASE")
+    if base_url:
+        import httpx
+        with httpx.Client(base_url=base_url, timeout=30) as http_client:
+            yield http_client
+    else:
+        from fastapi.testclient import TestClient
+        from src.api.app import app
+        with TestClient(app) as test_client:
+            yield test_client
@@ -1,142 +0,0 @@
-import sys
-import json
-import os
-
-# Add parent directory to path to access src modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from src.api.app import app
-
-def test_api():
-    """Test the API endpoints"""
-    print("TESTING API FUNCTIONALITY")
-    print("=" * 60)
-    
-    # Import requests for direct testing
-    import requests
-    import uvicorn
-    import threading
-    import time
-    
-    # Start server in background
-    def run_server():
-        uvicorn.run(app, host="127.0.0.1", port=8001, log_level="error")
-    
-    server_thread = threading.Thread(target=run_server, daemon=True)
-    server_thread.start()
-    time.sleep(2)  # Wait for server to start
-    
-    base_url = "http://127.0.0.1:8001"
-    
-    try:
-        # Test 1: Health check
-        print("Test 1: Health Check")
-        response = requests.get(f"{base_url}/health")
-        print(f"Status: {response.status_code}")
-        print(f"Response: {response.json()}")
-        
-        # Test 2: Root endpoint
-        print("\nTest 2: Root Endpoint")
-        response = requests.get(f"{base_url}/")
-        print(f"Status: {response.status_code}")
-        print(f"API Info: {response.json()['message']}")
-        
-        # Test 3: Categories endpoint
-        print("\nTest 3: Categories Endpoint")
-        response = requests.get(f"{base_url}/categories")
-        print(f"Status: {response.status_code}")
-        categories = response.json()
-        print(f"Total categories: {categories['total_categories']}")
-        print(f"Total products: {categories['total_products']}")
-        
-        # Test 4: Vendor qualification with lower threshold
-        print("\nTest 4: Vendor Qualification (threshold=0.4)")
-        query = {
-            "software_category": "CRM Software",
-            "capabilities": ["Lead Management", "Email Marketing"],
-            "similarity_threshold": 0.5,
-            "top_n": 5,
-            "include_explanations": True
-        }
-        
-        response = requests.post(f"{base_url}/vendor_qualification", json=query)
-        print(f"Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Total qualified vendors: {result['results']['total_qualified_vendors']}")
-            print(f"Returned vendors: {result['results']['returned_vendors']}")
-            print(f"Total feature matches: {result['matching_analysis']['total_feature_matches']}")
-            
-            if result['results']['ranked_vendors']:
-                top_vendor = result['results']['ranked_vendors'][0]
-                print(f"\nTOP VENDOR:")
-                print(f"   - Name: {top_vendor['product_name']}")
-                print(f"   - Vendor: {top_vendor['vendor']}")
-                print(f"   - Rank Score: {top_vendor['rank_score']:.3f}")
-                print(f"   - Max Similarity: {top_vendor['max_similarity_score']:.3f}")
-                print(f"   - Rating: {top_vendor['rating']}/5.0")
-                print(f"   - Matched Capabilities: {top_vendor['matched_capabilities']}")
-        else:
-            print(f"Error: {response.text}")
-        
-        # Test 5: Vendor qualification with higher threshold
-        print("\nTest 5: Vendor Qualification (threshold=0.6)")
-        query_high = {
-            "software_category": "CRM Software", 
-            "capabilities": ["Lead Management"],
-            "similarity_threshold": 0.6,
-            "top_n": 3
-        }
-        
-        response = requests.post(f"{base_url}/vendor_qualification", json=query_high)
-        print(f"Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"Total qualified vendors: {result['results']['total_qualified_vendors']}")
-            print(f"Threshold impact demonstrated: Higher threshold = fewer matches")
-        
-        # Test 6: Features endpoint
-        print("\nTest 6: Common Features")
-        response = requests.get(f"{base_url}/features?category=CRM&limit=10")
-        print(f"Status: {response.status_code}")
-        
-        if response.status_code == 200:
-            features = response.json()
-            print(f"Total unique features: {features['total_unique_features']}")
-            print(f"Top features: {list(features['common_features'].keys())[:5]}")
-        
-        print("\n" + "=" * 60)
-        print("API TESTING COMPLETED!")
-        print("=" * 60)
-        print("\nAll API endpoints are working correctly!")
-        print("   - Health check: PASS")
-        print("   - Vendor qualification: PASS")
-        print("   - Categories listing: PASS")
-        print("   - Features listing: PASS")
-        print("   - Semantic similarity matching: PASS")
-        print("   - Vendor ranking: PASS")
-        
-    except Exception as e:
-        print(f"API test failed: {e}")
-        print("Testing core functionality directly instead...")
-        
-        # Direct function testing as fallback
-        from src.similarity.feature_matcher import FeatureMatcher
-        from src.data_processing.data_loader import DataLoader
-        
-        loader = DataLoader("data/G2 software - CRM Category Product Overviews.csv")
-        matcher = FeatureMatcher(similarity_threshold=0.5)
-        
-        results = matcher.filter_vendors_by_category_and_capabilities(
-            dataframe=loader.preprocessed_dataset,
-            software_category="CRM Software",
-            capabilities=["Lead Management", "Email Marketing"]
-        )
-        
-        print(f"Direct test: Found {results['total_vendors']} vendors")
-        print("Core functionality working correctly!")
-
-if __name__ == "__main__":
-    test_api() 
\ No newline at end of file
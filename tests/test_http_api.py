@@ -0,0 +1,321 @@
+import pytest
+
+# Vendor qualification query used by the response-shape tests
+QUERY = {
+    "software_category": "CRM Software",
+    "capabilities": ["Lead Management", "Email Marketing"],
+    "similarity_threshold": 0.5,
+    "top_n": 5,
+    "include_explanations": True
+}
+
+# (payload, expected) cases for POST /vendor_qualification; each is an
+# independent request, so pytest-xdist can spread them across workers
+CASES = [
+    pytest.param(
+        {
+            "software_category": "CRM Software",
+            "capabilities": ["Lead Management", "Email Marketing"],
+            "similarity_threshold": 0.5,
+            "top_n": 5,
+            "include_explanations": False
+        },
+        {"status": 200, "has_vendors": True},
+        id="low_threshold"
+    ),
+    pytest.param(
+        {
+            "software_category": "CRM Software",
+            "capabilities": ["Lead Management"],
+            "similarity_threshold": 0.6,
+            "top_n": 3
+        },
+        {"status": 200, "has_vendors": False},
+        id="high_threshold"
+    ),
+    pytest.param(
+        {
+            "software_category": "CRM Software",
+            "capabilities": ["Contact Management"],
+            "similarity_threshold": 0.5,
+            "top_n": 3,
+            "include_explanations": True
+        },
+        {"status": 200},
+        id="with_explanations"
+    ),
+    pytest.param(
+        {
+            "software_category": "CRM Software",
+            "capabilities": ["Lead Management"],
+            "similarity_threshold": 0.9,
+            "top_n": 10
+        },
+        {"status": 200, "has_vendors": False},
+        id="edge_high_threshold"
+    ),
+    pytest.param(
+        {
+            "software_category": "CRM Software",
+            "capabilities": ["Lead Management"],
+            "similarity_threshold": 1.5
+        },
+        {"status": 422},
+        id="invalid_threshold"
+    ),
+]
+
+# Query lists for POST /vendor_qualification/batch: a threshold sweep sharing
+# one category and capability set, mixed groups with explanations and a
+# category that matches nothing, and the empty batch
+BATCHES = [
+    pytest.param(
+        [dict(QUERY, similarity_threshold=threshold, include_explanations=False)
+         for threshold in (0.5, 0.3, 0.4)],
+        id="threshold_sweep"
+    ),
+    pytest.param(
+        [
+            QUERY,
+            {"software_category": "Nonexistent Category", "capabilities": ["Lead Management"]},
+            {
+                "software_category": "CRM Software",
+                "capabilities": ["Contact Management"],
+                "similarity_threshold": 0.3,
+                "top_n": 3,
+                "include_explanations": True
+            },
+            dict(QUERY, similarity_threshold=0.6, include_explanations=False),
+        ],
+        id="mixed"
+    ),
+    pytest.param([], id="empty"),
+]
+
+# Top vendors for one query under the corpus-wide TF-IDF fit; a change to how
+# the matcher is fitted that reorders the ranking shows up here
+PINNED_QUERY = {
+    "software_category": "CRM Software",
+    "capabilities": ["Lead Management", "Email Marketing", "Contact Management"],
+    "similarity_threshold": 0.3,
+    "top_n": 10
+}
+PINNED_TOP_VENDORS = [
+    "AllClients", "Solid Performers CRM", "Fireberry", "EspoCRM", "Breakcold",
+    "Freshsales", "Zurmo", "Prospect CRM", "Pipeliner CRM", "Efficy CRM"
+]
+
+def test_health(client):
+    """Health check reports a loaded dataset"""
+    response = client.get("/health")
+    assert response.status_code == 200
+    
+    health = response.json()
+    assert health["status"] == "healthy"
+    assert health["data_loader_status"] == "initialized"
+    assert health["total_products"] > 0
+    assert health["total_features"] > 0
+
+def test_root(client):
+    """Root endpoint describes the API"""
+    response = client.get("/")
+    assert response.status_code == 200
+    
+    info = response.json()
+    assert info["message"]
+    assert info["version"]
+    assert "endpoints" in info
+
+def test_categories(client):
+    """Categories endpoint lists categories and product totals"""
+    response = client.get("/categories")
+    assert response.status_code == 200
+    
+    categories = response.json()
+    assert categories["total_categories"] == len(categories["available_categories"])
+    assert categories["total_products"] > 0
+
+@pytest.mark.parametrize("path", ["/categories", "/vendors?category=CRM", "/features?limit=5"])
+def test_cached_endpoint_headers(client, path):
+    """Static dataset endpoints send a weak ETag and a public Cache-Control"""
+    response = client.get(path)
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+@pytest.mark.parametrize("if_none_match", [
+    pytest.param("{etag}", id="exact"),
+    pytest.param("{opaque_tag}", id="strong"),
+    pytest.param('"stale", {etag}', id="list"),
+    pytest.param("*", id="wildcard"),
+])
+def test_cached_endpoint_not_modified(client, if_none_match):
+    """Sending the returned ETag back answers 304 with an empty body"""
+    etag = client.get("/categories").headers["etag"]
+    
+    header = if_none_match.format(etag=etag, opaque_tag=etag.removeprefix("W/"))
+    response = client.get("/categories", headers={"If-None-Match": header})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+def test_cached_endpoint_stale_etag(client):
+    """A non-matching ETag gets the full body"""
+    response = client.get("/categories", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["total_categories"] > 0
+
+@pytest.mark.parametrize("query,limit", [("limit=5", 5), ("category=CRM&limit=10", 10)])
+def test_features(client, query, limit):
+    """Features endpoint returns at most `limit` common features"""
+    response = client.get(f"/features?{query}")
+    assert response.status_code == 200
+    
+    features = response.json()
+    assert features["total_unique_features"] > 0
+    assert 0 < len(features["common_features"]) <= limit
+
+def test_vendors(client):
+    """Vendors endpoint filters by category"""
+    response = client.get("/vendors?category=CRM")
+    assert response.status_code == 200
+    
+    vendors = response.json()
+    assert vendors["category_filter"] == "CRM"
+    assert vendors["total_vendors"] == len(vendors["vendors"])
+
+def test_gzip_large_response(client):
+    """Responses over the middleware's minimum size are gzipped when accepted"""
+    response = client.get("/vendors", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["total_vendors"] > 0
+    
+    plain = client.get("/vendors", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+def test_gzip_etag_is_weak(client):
+    """Gzipped and identity bodies share one ETag, so it must be weak"""
+    gzipped = client.get("/vendors", headers={"Accept-Encoding": "gzip"})
+    plain = client.get("/vendors", headers={"Accept-Encoding": "identity"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == plain.headers["etag"]
+    assert gzipped.headers["etag"].startswith("W/")
+
+def test_gzip_small_response(client):
+    """Responses under the minimum size are sent uncompressed"""
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert len(response.content) < 1024
+    assert "content-encoding" not in response.headers
+
+@pytest.mark.parametrize("category", ["crm software", "CRM.Software", "CRM (Software", "CRM+"])
+def test_category_matching_consistent(client, category):
+    """Dataset endpoints and /vendor_qualification select the same rows, matched literally"""
+    features = client.get("/features", params={"category": category, "limit": 1000})
+    vendors = client.get("/vendors", params={"category": category})
+    assert features.status_code == vendors.status_code == 200
+    feature_rows = sum(features.json()["common_features"].values())
+    listed = {vendor["product_name"] for vendor in vendors.json()["vendors"]}
+    
+    # At threshold 0.0 every feature row in the selected categories matches
+    payload = {"software_category": category, "capabilities": ["Lead Management"],
+               "similarity_threshold": 0.0, "top_n": 100}
+    qualified = client.post("/vendor_qualification", json=payload)
+    assert qualified.status_code == 200
+    result = qualified.json()
+    ranked = {vendor["product_name"] for vendor in result["results"]["ranked_vendors"]}
+    
+    assert result.get("matching_analysis", {}).get("total_feature_matches", 0) == feature_rows
+    assert ranked <= listed
+    assert bool(feature_rows) == (category == "crm software")
+
+def test_vendor_qualification_response(client):
+    """Ranked vendors carry their scores, capabilities and explanations"""
+    response = client.post("/vendor_qualification", json=QUERY)
+    assert response.status_code == 200
+    
+    result = response.json()
+    assert result["matching_analysis"]["total_feature_matches"] > 0
+    assert "methodology" in result
+    
+    top_vendor = result["results"]["ranked_vendors"][0]
+    for key in ["product_name", "vendor", "rank_score", "max_similarity_score",
+                "rating", "matched_capabilities", "ranking_explanation"]:
+        assert key in top_vendor
+    assert 0 <= top_vendor["max_similarity_score"] <= 1
+
+def test_vendor_qual_pinned_ranking(client):
+    """Ranking for a fixed query stays the same across matcher changes"""
+    response = client.post("/vendor_qualification", json=PINNED_QUERY)
+    assert response.status_code == 200
+    
+    ranked_vendors = response.json()["results"]["ranked_vendors"]
+    assert [vendor["product_name"] for vendor in ranked_vendors] == PINNED_TOP_VENDORS
+
+def test_vendor_qual_no_echo(client):
+    """echo=0 reduces the echoed query to its category and leaves results unchanged"""
+    echoed = client.post("/vendor_qualification", json=QUERY)
+    reduced = client.post("/vendor_qualification?echo=0", json=QUERY)
+    assert echoed.status_code == reduced.status_code == 200
+    
+    echoed, reduced = echoed.json(), reduced.json()
+    assert echoed["query"] == QUERY
+    assert reduced["query"] == {"software_category": QUERY["software_category"]}
+    assert reduced["results"] == echoed["results"]
+
+@pytest.mark.parametrize("payload,expected", CASES)
+def test_vendor_qual(client, payload, expected):
+    """Vendor qualification responds as expected for each payload"""
+    response = client.post("/vendor_qualification", json=payload)
+    assert response.status_code == expected["status"]
+    
+    if response.status_code != 200:
+        return
+    
+    results = response.json()["results"]
+    ranked_vendors = results["ranked_vendors"]
+    assert len(ranked_vendors) <= payload["top_n"]
+    assert results["total_qualified_vendors"] >= len(ranked_vendors)
+    if "has_vendors" in expected:
+        assert bool(ranked_vendors) == expected["has_vendors"]
+    
+    scores = [vendor["rank_score"] for vendor in ranked_vendors]
+    assert scores == sorted(scores, reverse=True)
+
+def test_vendor_qual_zero_threshold(client):
+    """An explicit 0.0 threshold is used as given, not replaced by the default"""
+    payload = dict(QUERY, similarity_threshold=0.0, include_explanations=False)
+    response = client.post("/vendor_qualification", json=payload)
+    assert response.status_code == 200
+    
+    result = response.json()
+    assert result["matching_analysis"]["similarity_threshold_used"] == 0.0
+    assert result["methodology"]["similarity_matching"]["threshold"] == 0.0
+
+@pytest.mark.parametrize("queries", BATCHES)
+def test_vendor_qual_batch(client, queries):
+    """Each batch response equals the single-query response, in request order"""
+    response = client.post("/vendor_qualification/batch", json={"queries": queries})
+    assert response.status_code == 200
+    
+    batch = response.json()
+    assert batch["total_queries"] == len(queries)
+    assert len(batch["responses"]) == len(queries)
+    for query, batch_result in zip(queries, batch["responses"]):
+        single = client.post("/vendor_qualification", json=query)
+        assert single.status_code == 200
+        assert batch_result == single.json()
+
+def test_vendor_qual_batch_too_large(client):
+    """Batches over the query limit are rejected before any work is queued"""
+    # Read the limit the server under test advertises rather than importing the app
+    schema = client.get("/openapi.json").json()["components"]["schemas"]["VendorBatchQuery"]
+    limit = schema["properties"]["queries"]["maxItems"]
+    
+    response = client.post("/vendor_qualification/batch", json={"queries": [QUERY] * limit})
+    assert response.status_code == 200
+    
+    queries = [QUERY] * (limit + 1)
+    response = client.post("/vendor_qualification/batch", json={"queries": queries})
+    assert response.status_code == 422
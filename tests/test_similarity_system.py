@@ -1,7 +1,8 @@
 import sys
 import os
 import logging
-from typing import List
+import numpy as np
+import pandas as pd
 
 # Add parent directory to path to access src modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -9,6 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 from src.data_processing.data_loader import DataLoader
 from src.similarity.feature_matcher import FeatureMatcher
 from src.ranking.vendor_ranker import VendorRanker
+from tests._warmcache import EMBEDDINGS_CACHE_DIR, cached_loader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,7 +23,7 @@ def test_data_loading():
     print("=" * 60)
     
     try:
-        loader = DataLoader("data/G2 software - CRM Category Product Overviews.csv")
+        loader = cached_loader("data/G2 software - CRM Category Product Overviews.csv")
         
         print(f"Original data shape: {loader.data.shape}")
         print(f"Preprocessed data shape: {loader.preprocessed_dataset.shape}")
@@ -30,8 +32,10 @@ def test_data_loading():
         
         # Show sample of flattened data
         print("\nSample of flattened feature data:")
+        # Rows are formatted directly rather than through pandas' table repr
         sample = loader.preprocessed_dataset[['product_name', 'seller', 'Feature_name', 'Feature_percent']].head()
-        print(sample.to_string())
+        for row in sample.itertuples(index=False):
+            print(f"   {row.product_name} | {row.seller} | {row.Feature_name} | {row.Feature_percent}")
         
         return loader
         
@@ -39,28 +43,43 @@ def test_data_loading():
         print(f"Data loading failed: {e}")
         return None
 
-def test_similarity_matching(loader: DataLoader):
+def fit_matcher(loader: DataLoader) -> FeatureMatcher:
+    """
+    One matcher fitted on the corpus once; tests vary the threshold per query.
+    
+    float32 vectors halve the matrix bandwidth; the printed 3-decimal scores
+    are the same as with float64.
+    """
+    matcher = FeatureMatcher(similarity_threshold=0.5, dtype=np.float32)
+    return matcher.fit(loader.preprocessed_dataset, cache_dir=EMBEDDINGS_CACHE_DIR)
+
+def test_similarity_matching(loader: DataLoader, matcher: FeatureMatcher):
     """Test semantic similarity matching"""
     print("\n" + "=" * 60)
     print("TESTING SEMANTIC SIMILARITY MATCHING")
     print("=" * 60)
     
     try:
-        matcher = FeatureMatcher(similarity_threshold=0.5)
-        
-        # Test case 1: CRM with Lead Management
-        print("\nTest Case 1: CRM Software + Lead Management")
-        results1 = matcher.filter_vendors_by_category_and_capabilities(
+        # All three cases query subsets of the same capabilities at 0.4 or 0.5,
+        # so score the union once at the lower threshold and narrow it per case
+        all_results = matcher.filter_vendors_by_category_and_capabilities(
             dataframe=loader.preprocessed_dataset,
             software_category="CRM Software",
-            capabilities=["Lead Management"]
+            capabilities=["Lead Management", "Email Marketing", "Contact Management"],
+            similarity_threshold=0.4
         )
+        results2 = matcher.apply_threshold(all_results, 0.5)
+        results3 = matcher.select_capabilities(all_results, ["Lead Management"])
+        
+        # Test case 1: CRM with Lead Management
+        print("\nTest Case 1: CRM Software + Lead Management")
+        results1 = matcher.apply_threshold(results3, 0.5)
         
         print(f"Found {results1['total_vendors']} vendors with {results1['total_matches']} feature matches")
         
         if results1['matching_vendors']:
             # Show top vendor
-            top_vendor = list(results1['matching_vendors'].values())[0]
+            top_vendor = next(iter(results1['matching_vendors'].values()))
             print(f"Top vendor: {top_vendor['product_name']} by {top_vendor['vendor']}")
             print(f"   - Max similarity: {top_vendor['max_similarity_score']:.3f}")
             print(f"   - Total matches: {top_vendor['total_matches']}")
@@ -68,23 +87,10 @@ def test_similarity_matching(loader: DataLoader):
         
         # Test case 2: CRM with multiple capabilities
         print("\nTest Case 2: CRM Software + Multiple Capabilities")
-        results2 = matcher.filter_vendors_by_category_and_capabilities(
-            dataframe=loader.preprocessed_dataset,
-            software_category="CRM Software",
-            capabilities=["Lead Management", "Email Marketing", "Contact Management"]
-        )
-        
         print(f"Found {results2['total_vendors']} vendors with {results2['total_matches']} feature matches")
         
         # Test case 3: Lower threshold
         print("\nTest Case 3: Lower Threshold (0.4)")
-        matcher_low = FeatureMatcher(similarity_threshold=0.4)
-        results3 = matcher_low.filter_vendors_by_category_and_capabilities(
-            dataframe=loader.preprocessed_dataset,
-            software_category="CRM Software",
-            capabilities=["Lead Management"]
-        )
-        
         print(f"Found {results3['total_vendors']} vendors with {results3['total_matches']} feature matches")
         print(f"Threshold impact: {results3['total_vendors'] - results1['total_vendors']} more vendors at 0.4 vs 0.5")
         
@@ -103,19 +109,13 @@ def test_vendor_ranking(loader: DataLoader, matching_results: dict):
     try:
         ranker = VendorRanker(feature_weight=0.7, rating_weight=0.3)
         
-        # Add ratings to vendor data
-        enhanced_vendors = {}
-        for vendor_key, vendor_data in matching_results['matching_vendors'].items():
-            product_name = vendor_data['product_name']
-            original_data = loader.data[loader.data['product_name'] == product_name]
-            
-            if not original_data.empty:
-                rating = original_data.iloc[0].get('rating', 0.0)
-                vendor_data['rating'] = rating
-            else:
-                vendor_data['rating'] = 0.0
-            
-            enhanced_vendors[vendor_key] = vendor_data
+        # Add ratings to vendor data from the loader's product -> rating map, the
+        # same lookup the API uses, instead of scanning the frame per vendor
+        product_rating = loader.product_rating
+        enhanced_vendors = {
+            vendor_key: {**vendor_data, 'rating': product_rating.get(vendor_data['product_name'], 0.0)}
+            for vendor_key, vendor_data in matching_results['matching_vendors'].items()
+        }
         
         # Rank vendors
         ranked_vendors = ranker.rank_vendors(enhanced_vendors, top_n=5)
@@ -146,14 +146,12 @@ def test_vendor_ranking(loader: DataLoader, matching_results: dict):
         print(f"Vendor ranking failed: {e}")
         return None
 
-def test_edge_cases(loader: DataLoader):
+def test_edge_cases(loader: DataLoader, matcher: FeatureMatcher):
     """Test edge cases and error handling"""
     print("\n" + "=" * 60)
     print("TESTING EDGE CASES")
     print("=" * 60)
     
-    matcher = FeatureMatcher(similarity_threshold=0.5)
-    
     # Test 1: Non-existent category
     print("Test: Non-existent category")
     results = matcher.filter_vendors_by_category_and_capabilities(
@@ -165,11 +163,11 @@ def test_edge_cases(loader: DataLoader):
     
     # Test 2: Very high threshold
     print("\nTest: Very high threshold (0.95)")
-    matcher_high = FeatureMatcher(similarity_threshold=0.95)
-    results = matcher_high.filter_vendors_by_category_and_capabilities(
+    results = matcher.filter_vendors_by_category_and_capabilities(
         dataframe=loader.preprocessed_dataset,
         software_category="CRM Software",
-        capabilities=["Lead Management"]
+        capabilities=["Lead Management"],
+        similarity_threshold=0.95
     )
     print(f"High threshold handled: {results['total_vendors']} vendors found")
     
@@ -182,6 +180,75 @@ def test_edge_cases(loader: DataLoader):
     )
     print(f"Empty capabilities handled: {results['total_vendors']} vendors found")
 
+def tiny_feature_frame() -> pd.DataFrame:
+    """A handful of preprocessed feature rows, enough to exercise the helpers"""
+    return pd.DataFrame({
+        'product_name': ['Alpha CRM', 'Alpha CRM', 'Beta CRM', 'Beta CRM', 'Gamma HR'],
+        'seller': ['Alpha', 'Alpha', 'Beta', 'Beta', 'Gamma'],
+        'main_category': ['CRM Software', 'CRM Software', 'CRM Software', 'CRM Software', 'HR Software'],
+        'Features_Category': ['Sales', 'Marketing', 'Sales', 'Contacts', 'People'],
+        'Feature_name': ['Lead Management', 'Email Marketing', 'Lead Scoring', 'Contact Management', 'Payroll'],
+        'Feature_description': ['Track and qualify leads', 'Send email campaigns', 'Score leads',
+                                'Manage contact records', 'Run payroll'],
+        'Feature_percent': [90, 85, 80, 88, 70],
+        'Feature_review': [10, 12, 8, 9, 5]
+    })
+
+def test_select_capabilities():
+    """Narrowing union results to some capabilities matches querying them directly"""
+    features = tiny_feature_frame()
+    matcher = FeatureMatcher(similarity_threshold=0.5).fit(features)
+    capabilities = ["Lead Management", "Email Marketing", "Contact Management"]
+    
+    union = matcher.filter_vendors_by_category_and_capabilities(
+        dataframe=features, software_category="CRM Software",
+        capabilities=capabilities, similarity_threshold=0.1
+    )
+    for subset in (["Lead Management"], ["Lead Management", "Contact Management"]):
+        direct = matcher.filter_vendors_by_category_and_capabilities(
+            dataframe=features, software_category="CRM Software",
+            capabilities=subset, similarity_threshold=0.1
+        )
+        assert direct['total_matches'] > 0
+        assert matcher.select_capabilities(union, subset) == direct
+
+def test_apply_threshold():
+    """Raising the threshold keeps only the stronger matches and regroups vendors"""
+    matcher = FeatureMatcher()
+    matches = [
+        {'product_name': product, 'vendor': vendor, 'main_category': 'CRM Software',
+         'feature_category': 'Sales', 'feature_name': feature, 'feature_description': '',
+         'feature_percent': 90, 'feature_review_count': 10,
+         'matched_capability': 'Lead Management', 'similarity_score': score}
+        for product, vendor, feature, score in [
+            ('Alpha CRM', 'Alpha', 'Lead Management', 0.9),
+            ('Beta CRM', 'Beta', 'Lead Scoring', 0.6),
+            ('Alpha CRM', 'Alpha', 'Lead Tracking', 0.45),
+            ('Gamma CRM', 'Gamma', 'Leads', 0.42),
+        ]
+    ]
+    results = {
+        'matching_vendors': matcher.select_matching_vendors(matches),
+        'total_vendors': 3,
+        'total_matches': len(matches),
+        'capabilities_searched': ['Lead Management'],
+        'category_searched': 'CRM Software',
+        'similarity_threshold': 0.4,
+        'raw_matches': matches
+    }
+    
+    narrowed = matcher.apply_threshold(results, 0.5)
+    assert narrowed['raw_matches'] == matches[:2]
+    assert list(narrowed['matching_vendors']) == ['Alpha CRM_Alpha', 'Beta CRM_Beta']
+    assert narrowed['matching_vendors']['Alpha CRM_Alpha']['total_matches'] == 1
+    assert (narrowed['total_vendors'], narrowed['total_matches']) == (2, 2)
+    assert narrowed['similarity_threshold'] == 0.5
+    assert narrowed['category_searched'] == 'CRM Software'
+    
+    # Results for an empty category only take the new threshold
+    empty = {key: value for key, value in results.items() if key != 'raw_matches'}
+    assert matcher.apply_threshold(empty, 0.5) == {**empty, 'similarity_threshold': 0.5}
+
 def main():
     """Main test function"""
     print("VENDOR QUALIFICATION SYSTEM - COMPREHENSIVE TEST")
@@ -193,8 +260,10 @@ def main():
         print("Cannot proceed without data loader")
         return
     
+    matcher = fit_matcher(loader)
+    
     # Test 2: Similarity Matching
-    matching_results = test_similarity_matching(loader)
+    matching_results = test_similarity_matching(loader, matcher)
     if not matching_results:
         print("Cannot proceed without similarity matching")
         return
@@ -206,7 +275,11 @@ def main():
         return
     
     # Test 4: Edge Cases
-    test_edge_cases(loader)
+    test_edge_cases(loader, matcher)
+    
+    # Result-narrowing helpers on a tiny hand-built corpus
+    test_select_capabilities()
+    test_apply_threshold()
     
     print("\n" + "=" * 60)
     print("ALL TESTS COMPLETED SUCCESSFULLY!")